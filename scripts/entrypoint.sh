@@ -121,6 +121,9 @@ if [ "${WEBUI_ENABLED:-true}" = "true" ]; then
     uvicorn webapp.main:app \
         --host 0.0.0.0 \
         --port "${WEBUI_PORT:-8080}" \
+        --loop uvloop \
+        --ws-ping-interval 20 \
+        --ws-ping-timeout 20 \
         --log-level info \
         --access-log &
     WEBUI_PID=$!
@@ -2,12 +2,24 @@
 Application configuration from environment variables.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    """Read version from VERSION file."""
+    """Return the application version (cached for the process lifetime).
+
+    The Docker build generates webapp/_version.py from the VERSION file so
+    released images pay no file I/O here; the VERSION file read remains as
+    a fallback for source checkouts.
+    """
+    try:
+        from webapp._version import VERSION
+        return VERSION
+    except ImportError:
+        pass
     version_file = Path(__file__).parent / "VERSION"
     if version_file.exists():
         return version_file.read_text().strip()
@@ -15,24 +27,30 @@ def get_version() -> str:
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """Application settings loaded from environment variables.
+
+    Field names map directly to their upper-cased environment variables
+    (e.g. ``lucidlink_filespace`` <- ``LUCIDLINK_FILESPACE``); pydantic-settings
+    reads the environment and coerces types, so no ``os.getenv`` wrappers
+    are needed here.
+    """
 
     # LucidLink settings
-    lucidlink_filespace: str = os.getenv("LUCIDLINK_FILESPACE", "")
-    lucidlink_user: str = os.getenv("LUCIDLINK_USER", "")
-    lucidlink_mount_point: str = os.getenv("LUCIDLINK_MOUNT_POINT", "/data/filespace")
-    local_data_path: str = os.getenv("LOCAL_DATA_PATH", "/data/local")
+    lucidlink_filespace: str = ""
+    lucidlink_user: str = ""
+    lucidlink_mount_point: str = "/data/filespace"
+    local_data_path: str = "/data/local"
 
     # Sync settings
-    sync_direction: str = os.getenv("SYNC_DIRECTION", "local-to-filespace")
-    sync_interval: int = int(os.getenv("SYNC_INTERVAL", "300"))
-    parallel_jobs: int = int(os.getenv("PARALLEL_JOBS", "4"))
-    rsync_options: str = os.getenv("RSYNC_OPTIONS", "-avz --progress")
-    sync_exclude: str = os.getenv("SYNC_EXCLUDE", ".DS_Store,Thumbs.db,*.tmp")
+    sync_direction: str = "local-to-filespace"
+    sync_interval: int = 300
+    parallel_jobs: int = 4
+    rsync_options: str = "-avz --progress"
+    sync_exclude: str = ".DS_Store,Thumbs.db,*.tmp"
 
     # Web UI settings
-    webui_enabled: bool = os.getenv("WEBUI_ENABLED", "true").lower() == "true"
-    webui_port: int = int(os.getenv("WEBUI_PORT", "8080"))
+    webui_enabled: bool = True
+    webui_port: int = 8080
 
     # Paths
     config_path: str = "/config"
@@ -43,7 +61,24 @@ class Settings(BaseSettings):
     app_version: str = get_version()
 
     class Config:
-        env_file = ".env"
+        # Only parse a dotenv file when one is explicitly requested; in
+        # container deployments env vars come from the orchestrator and
+        # skipping the file probe avoids a syscall at startup.
+        env_file = os.getenv("ENV_FILE") or None
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    Cached so module reloads (tests, --reload workers) don't re-run the
+    full pydantic-settings environment validation; tests can override via
+    FastAPI's dependency_overrides or ``get_settings.cache_clear()``.
+    """
+    env_file = Settings.Config.env_file
+    if env_file:
+        print(f"Loading settings from environment and {env_file}")
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -5,42 +5,61 @@ import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from webapp.config import settings
-from webapp.routers import api, pages, websocket
-from webapp.services.sync_manager import sync_manager
-from webapp.services.filename_issues import filename_issues_manager
+from webapp.templating import templates
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown events."""
+    # Imported here so the service singletons (and their pydantic model
+    # schemas) are built on startup, not when this module is first imported.
+    from webapp.services.sync_manager import sync_manager
+    from webapp.services.filename_issues import filename_issues_manager
+    from webapp.models.sync_job import (
+        SyncJob,
+        SyncJobCreate,
+        SyncJobUpdate,
+        SyncProgress,
+        SystemStatus,
+        FileInfo,
+        JobStats,
+    )
+
+    # Warm pydantic-core validator/serializer caches for the hot response
+    # models so the first GET /jobs doesn't pay the lazy schema-build cost.
+    for model in (SyncJob, SyncJobCreate, SyncJobUpdate, SyncProgress,
+                  SystemStatus, FileInfo, JobStats):
+        model.model_rebuild()
+
     # Startup: Load existing jobs and filename issues from persistence
     await sync_manager.load_jobs()
     await filename_issues_manager.load()
     yield
-    # Shutdown: Stop all running jobs gracefully
+    # Shutdown: Stop all running jobs gracefully and flush pending writes
     await sync_manager.shutdown()
+    await filename_issues_manager.flush()
 
 
 app = FastAPI(
     title="LucidLink Sync",
     description="Web UI for managing LucidLink sync jobs",
     version=settings.app_version,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Include routers
+# Include routers (imported here, after app construction, so the FastAPI
+# instance exists before the router modules pull in their service singletons)
+from webapp.routers import api, pages, websocket  # noqa: E402
+
 app.include_router(api.router, prefix="/api/v1", tags=["api"])
 app.include_router(websocket.router, tags=["websocket"])
 app.include_router(pages.router, tags=["pages"])
 
-# Templates
-templates = Jinja2Templates(directory="/webapp/templates")
-
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint for container orchestration."""
@@ -60,4 +79,11 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.webui_port,
         reload=False,
+        # uvloop ships with uvicorn[standard]; the libuv-based loop cuts
+        # per-await overhead on the WebSocket fan-out and subprocess paths
+        loop="uvloop",
+        # Protocol-level keepalive, replacing per-connection timer churn
+        # in the WebSocket handlers
+        ws_ping_interval=20.0,
+        ws_ping_timeout=20.0,
     )
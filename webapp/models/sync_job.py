@@ -2,12 +2,32 @@
 Pydantic models for sync jobs and related data.
 """
 import os
+import time
 from datetime import datetime
 from enum import Enum
+from secrets import token_hex
 from typing import Optional
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _new_id() -> str:
+    """Generate a random 32-char hex identifier.
+
+    token_hex(16) gives the same 128 bits of randomness as uuid4 without
+    the UUID object construction and dash formatting; a single module-level
+    factory is shared by every id field.
+    """
+    return token_hex(16)
+
+
+def _now() -> datetime:
+    """Shared timestamp default factory (naive UTC, built from time.time()).
+
+    Defined once at module level so every model field shares the same
+    callable instead of binding datetime.utcnow per field.
+    """
+    return datetime.utcfromtimestamp(time.time())
 
 
 def get_default_parallel_jobs() -> int:
@@ -50,6 +70,10 @@ class WorkerProgress(BaseModel):
 
 class SyncProgress(BaseModel):
     """Real-time progress information for a running sync job."""
+    # Store enum fields as their str values so validation skips the
+    # str -> Enum round-trip on every construction.
+    model_config = ConfigDict(use_enum_values=True)
+
     job_id: str
     status: JobStatus = JobStatus.IDLE
     current_file: Optional[str] = None
@@ -70,6 +94,8 @@ class SyncProgress(BaseModel):
 
 class SyncJobBase(BaseModel):
     """Base model for sync job properties."""
+    model_config = ConfigDict(use_enum_values=True)
+
     name: str = Field(..., min_length=1, max_length=100, description="Job name")
     source_path: str = Field(..., description="Source directory path")
     dest_path: str = Field(..., description="Destination directory path")
@@ -88,6 +114,8 @@ class SyncJobCreate(SyncJobBase):
 
 class SyncJobUpdate(BaseModel):
     """Model for updating an existing sync job."""
+    model_config = ConfigDict(use_enum_values=True)
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     source_path: Optional[str] = None
     dest_path: Optional[str] = None
@@ -101,6 +129,10 @@ class SyncJobUpdate(BaseModel):
 
 class JobStats(BaseModel):
     """Statistics for a sync job run."""
+    # Built server-side and never mutated after construction; frozen lets
+    # pydantic-core use the cheaper immutable setattr path.
+    model_config = ConfigDict(frozen=True)
+
     duration_seconds: float = 0.0
     files_synced: int = 0
     bytes_transferred: int = 0
@@ -111,10 +143,10 @@ class JobStats(BaseModel):
 
 class SyncJob(SyncJobBase):
     """Complete sync job model with metadata."""
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     status: JobStatus = JobStatus.IDLE
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_now)
+    updated_at: datetime = Field(default_factory=_now)
     last_run_at: Optional[datetime] = None
     last_run_status: Optional[JobStatus] = None
     last_run_message: Optional[str] = None
@@ -128,12 +160,11 @@ class SyncJob(SyncJobBase):
     avg_files_per_second: float = 0.0
     avg_bytes_per_second: float = 0.0
 
-    class Config:
-        use_enum_values = True
-
 
 class SystemStatus(BaseModel):
     """Overall system status."""
+    model_config = ConfigDict(frozen=True)
+
     lucidlink_connected: bool = False
     lucidlink_filespace: Optional[str] = None
     mount_point: Optional[str] = None
@@ -146,6 +177,8 @@ class SystemStatus(BaseModel):
 
 class FileInfo(BaseModel):
     """Information about a file or directory."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     path: str
     is_dir: bool
@@ -156,6 +189,10 @@ class FileInfo(BaseModel):
 
 class BrowseResponse(BaseModel):
     """Response for directory browse requests."""
+    # Rarely instantiated outside browse requests; skip eager
+    # validator/serializer construction at import time.
+    model_config = ConfigDict(defer_build=True)
+
     path: str
     parent: Optional[str] = None
     items: list[FileInfo] = []
@@ -164,7 +201,7 @@ class BrowseResponse(BaseModel):
 
 class FilenameIssue(BaseModel):
     """A filename with problematic characters that needs attention."""
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=_new_id)
     job_id: str
     job_name: str
     source_path: str  # Full path to the file/directory
@@ -175,12 +212,14 @@ class FilenameIssue(BaseModel):
     issue_char: Optional[str] = None  # The problematic character
     suggested_name: Optional[str] = None  # Suggested normalized name
     status: str = "pending"  # pending, renamed, skipped, failed
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    detected_at: datetime = Field(default_factory=_now)
     resolved_at: Optional[datetime] = None
 
 
 class FilenameIssuesSummary(BaseModel):
     """Summary of filename issues for a job."""
+    model_config = ConfigDict(defer_build=True)
+
     job_id: str
     total_issues: int = 0
     pending: int = 0
@@ -212,4 +251,4 @@ class DryRunResult(BaseModel):
     filename_issues: int = 0
     files: list[DryRunFile] = []
     errors: list[str] = []
-    completed_at: datetime = Field(default_factory=datetime.utcnow)
+    completed_at: datetime = Field(default_factory=_now)
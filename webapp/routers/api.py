@@ -1,6 +1,7 @@
 """
 REST API endpoints for sync job management.
 """
+from itertools import islice
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
@@ -28,18 +29,21 @@ router = APIRouter()
 @router.get("/browse/local", response_model=BrowseResponse)
 async def browse_local(path: str = Query(default="", description="Path relative to local data root")):
     """Browse the local data directory."""
-    return file_browser.browse_local(path)
+    return await file_browser.browse_local_async(path)
 
 
 @router.get("/browse/filespace", response_model=BrowseResponse)
 async def browse_filespace(path: str = Query(default="", description="Path relative to filespace root")):
     """Browse the LucidLink filespace directory."""
-    return file_browser.browse_filespace(path)
+    return await file_browser.browse_filespace_async(path)
 
 
 # Job CRUD endpoints
-@router.get("/jobs", response_model=list[SyncJob])
-async def list_jobs():
+# Hot read endpoints return models the sync manager already validated, so
+# response_model re-validation is disabled (response_model=None); the return
+# annotations are kept for readers and OpenAPI-free docs.
+@router.get("/jobs", response_model=None)
+async def list_jobs() -> list[SyncJob]:
     """List all sync jobs."""
     return await sync_manager.list_jobs()
 
@@ -50,8 +54,8 @@ async def create_job(job: SyncJobCreate):
     return await sync_manager.create_job(job)
 
 
-@router.get("/jobs/{job_id}", response_model=SyncJob)
-async def get_job(job_id: str):
+@router.get("/jobs/{job_id}", response_model=None)
+async def get_job(job_id: str) -> SyncJob:
     """Get a specific sync job."""
     job = await sync_manager.get_job(job_id)
     if not job:
@@ -103,17 +107,13 @@ async def dry_run_job(job_id: str):
     return result
 
 
-@router.get("/jobs/{job_id}/progress", response_model=Optional[SyncProgress])
-async def get_job_progress(job_id: str):
+@router.get("/jobs/{job_id}/progress", response_model=None)
+async def get_job_progress(job_id: str) -> Optional[SyncProgress]:
     """Get current progress of a sync job."""
-    progress = sync_manager.get_progress(job_id)
-    if not progress:
-        # Return empty progress if job exists but hasn't been run
-        job = await sync_manager.get_job(job_id)
-        if not job:
-            raise HTTPException(status_code=404, detail="Job not found")
-        return None
-    return progress
+    if not sync_manager.has_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    # None means the job exists but hasn't been run yet
+    return sync_manager.get_progress(job_id)
 
 
 # System status endpoints
@@ -142,9 +142,12 @@ async def get_available_logs():
 
 # Filename Issues endpoints
 @router.get("/filename-issues", response_model=list[FilenameIssue])
-async def list_all_filename_issues():
-    """List all filename issues across all jobs."""
-    return list(filename_issues_manager.issues.values())
+async def list_all_filename_issues(
+    skip: int = Query(default=0, ge=0, description="Number of issues to skip"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Maximum issues to return"),
+):
+    """List filename issues across all jobs (paginated)."""
+    return list(islice(filename_issues_manager.issues.values(), skip, skip + limit))
 
 
 @router.get("/filename-issues/pending", response_model=list[FilenameIssue])
@@ -3,14 +3,13 @@ HTML page routes for the web UI.
 """
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from webapp.config import settings
 from webapp.services.sync_manager import sync_manager
 from webapp.services.file_browser import file_browser
+from webapp.templating import templates
 
 router = APIRouter()
-templates = Jinja2Templates(directory="/webapp/templates")
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -64,12 +63,7 @@ async def edit_job(request: Request, job_id: str):
 async def jobs_list_partial(request: Request):
     """HTMX partial for jobs list."""
     jobs = await sync_manager.list_jobs()
-    # Get progress for each job
-    progress_map = {}
-    for job in jobs:
-        progress = sync_manager.get_progress(job.id)
-        if progress:
-            progress_map[job.id] = progress
+    progress_map = sync_manager.get_progress_map([job.id for job in jobs])
     return templates.TemplateResponse(
         "partials/jobs_list.html",
         {
@@ -115,9 +109,9 @@ async def status_partial(request: Request):
 async def browser_partial(request: Request, location: str, path: str = ""):
     """HTMX partial for file browser."""
     if location == "local":
-        result = file_browser.browse_local(path)
+        result = await file_browser.browse_local_async(path)
     elif location == "filespace":
-        result = file_browser.browse_filespace(path)
+        result = await file_browser.browse_filespace_async(path)
     else:
         return HTMLResponse(content="Invalid location", status_code=400)
 
@@ -135,15 +129,12 @@ async def browser_partial(request: Request, location: str, path: str = ""):
 async def path_picker_partial(request: Request, location: str, path: str = ""):
     """HTMX partial for path picker (folders only)."""
     if location == "local":
-        result = file_browser.browse_local(path)
+        result = await file_browser.browse_local_async(path, dirs_only=True)
     elif location == "filespace":
-        result = file_browser.browse_filespace(path)
+        result = await file_browser.browse_filespace_async(path, dirs_only=True)
     else:
         return HTMLResponse(content="Invalid location", status_code=400)
 
-    # Filter to directories only
-    result.items = [item for item in result.items if item.is_dir]
-
     return templates.TemplateResponse(
         "partials/path_picker.html",
         {
@@ -173,9 +164,8 @@ async def logs_partial(request: Request, log_type: str = "container", lines: int
 async def filename_issues_partial(request: Request):
     """HTMX partial for filename issues list."""
     from webapp.services.filename_issues import filename_issues_manager
-    issues = list(filename_issues_manager.issues.values())
-    # Sort: pending first, then by detected_at descending
-    issues.sort(key=lambda x: (x.status != 'pending', x.detected_at), reverse=True)
+    # Pending first, newest first — maintained by the manager, no sort needed
+    issues = filename_issues_manager.get_issues_sorted()
     return templates.TemplateResponse(
         "partials/filename_issues.html",
         {
@@ -2,10 +2,12 @@
 WebSocket handlers for real-time updates.
 """
 import asyncio
-import json
 from typing import Set
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
 from webapp.models.sync_job import SyncProgress
 from webapp.services.sync_manager import sync_manager
@@ -18,103 +20,157 @@ class ConnectionManager:
     """Manages WebSocket connections for broadcasting."""
 
     def __init__(self):
-        # Connections organized by channel type
-        self.progress_connections: dict[str, Set[WebSocket]] = {}  # job_id -> connections
+        # Connections organized by channel type. Each progress connection
+        # gets a bounded outbound queue drained by its own writer task, so
+        # one slow client can't stall broadcasts to the others.
+        self.progress_connections: dict[str, dict[WebSocket, asyncio.Queue]] = {}
         self.log_connections: Set[WebSocket] = set()
+        self._writer_tasks: dict[WebSocket, asyncio.Task] = {}
+        self._reaper_task: asyncio.Task | None = None
+
+    def _ensure_reaper(self):
+        """Lazily start the background task that reaps dead connections."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self):
+        """Periodically drop connections whose sockets are no longer open.
 
-    async def connect_progress(self, websocket: WebSocket, job_id: str):
+        Writer tasks already tear down on send failure; this catches
+        clients that vanished without a clean close and never get sent to
+        (e.g. idle jobs with no progress ticks).
+        """
+        while True:
+            await asyncio.sleep(30)
+            for job_id, connections in list(self.progress_connections.items()):
+                for ws in list(connections):
+                    if ws.client_state != WebSocketState.CONNECTED:
+                        self.disconnect_progress(ws, job_id)
+            for ws in list(self.log_connections):
+                if ws.client_state != WebSocketState.CONNECTED:
+                    self.disconnect_logs(ws)
+
+    async def connect_progress(self, websocket: WebSocket, job_id: str) -> asyncio.Queue:
         """Connect a client to progress updates for a job."""
         await websocket.accept()
-        if job_id not in self.progress_connections:
-            self.progress_connections[job_id] = set()
-        self.progress_connections[job_id].add(websocket)
+        self._ensure_reaper()
+        if not self.progress_connections:
+            # First client: subscribe to the sync manager, so jobs
+            # running with no watchers pay nothing for progress ticks
+            sync_manager.register_progress_callback(progress_callback)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        self.progress_connections.setdefault(job_id, {})[websocket] = queue
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._writer(websocket, job_id, queue)
+        )
+        return queue
 
     def disconnect_progress(self, websocket: WebSocket, job_id: str):
         """Disconnect a client from progress updates."""
-        if job_id in self.progress_connections:
-            self.progress_connections[job_id].discard(websocket)
-            if not self.progress_connections[job_id]:
+        connections = self.progress_connections.get(job_id)
+        if connections is not None:
+            connections.pop(websocket, None)
+            if not connections:
                 del self.progress_connections[job_id]
+                if not self.progress_connections:
+                    # Last client gone: stop receiving progress ticks
+                    sync_manager.unregister_progress_callback(progress_callback)
+        task = self._writer_tasks.pop(websocket, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _writer(self, websocket: WebSocket, job_id: str, queue: asyncio.Queue):
+        """Drain one connection's outbound queue; a send failure is terminal."""
+        try:
+            while True:
+                message = await queue.get()
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect_progress(websocket, job_id)
 
     async def connect_logs(self, websocket: WebSocket):
         """Connect a client to log streaming."""
         await websocket.accept()
+        self._ensure_reaper()
         self.log_connections.add(websocket)
 
     def disconnect_logs(self, websocket: WebSocket):
         """Disconnect a client from log streaming."""
         self.log_connections.discard(websocket)
 
+    @staticmethod
+    def serialize_progress(progress: SyncProgress) -> str:
+        """Serialize a progress snapshot.
+
+        SyncManager mutates one SyncProgress instance in place for the
+        whole run, so the snapshot must be serialized per broadcast; the
+        buffer is shared only across the subscribers of a single
+        broadcast below.
+        """
+        return orjson.dumps(progress.model_dump()).decode()
+
     async def broadcast_progress(self, job_id: str, progress: SyncProgress):
         """Broadcast progress update to all connected clients for a job."""
-        if job_id not in self.progress_connections:
+        connections = self.progress_connections.get(job_id)
+        if not connections:
             return
 
-        message = progress.model_dump_json()
-        dead_connections = set()
-
-        for connection in self.progress_connections[job_id]:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                dead_connections.add(connection)
-
-        # Clean up dead connections
-        for conn in dead_connections:
-            self.progress_connections[job_id].discard(conn)
+        # One encode per broadcast, fanned out to every subscriber
+        message = self.serialize_progress(progress)
+        for queue in connections.values():
+            # Drop the oldest update when a client falls behind; progress
+            # is keep-latest, so skipping stale ticks is correct
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
 
     async def broadcast_log(self, line: str):
         """Broadcast log line to all connected clients."""
         if not self.log_connections:
             return
 
-        message = json.dumps({"line": line})
-        dead_connections = set()
-
-        for connection in self.log_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                dead_connections.add(connection)
+        message = '{"line": ' + orjson.dumps(line).decode() + '}'
+        connections = list(self.log_connections)
+        results = await asyncio.gather(
+            *(conn.send_text(message) for conn in connections),
+            return_exceptions=True,
+        )
 
         # Clean up dead connections
-        for conn in dead_connections:
-            self.log_connections.discard(conn)
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.log_connections.discard(conn)
 
 
 # Global connection manager
 manager = ConnectionManager()
 
 
-# Register progress callback with sync manager
+# Progress callback for the sync manager; registered by the connection
+# manager while at least one progress client is connected
 async def progress_callback(job_id: str, progress: SyncProgress):
     """Callback for sync manager to broadcast progress updates."""
     await manager.broadcast_progress(job_id, progress)
 
 
-sync_manager.register_progress_callback(progress_callback)
-
-
 @router.websocket("/ws/progress/{job_id}")
 async def websocket_progress(websocket: WebSocket, job_id: str):
     """WebSocket endpoint for real-time job progress updates."""
-    await manager.connect_progress(websocket, job_id)
+    queue = await manager.connect_progress(websocket, job_id)
     try:
-        # Send current progress if available
+        # Send current progress if available (through the queue, so the
+        # writer task stays the only sender on this socket)
         current_progress = sync_manager.get_progress(job_id)
         if current_progress:
-            await websocket.send_text(current_progress.model_dump_json())
+            queue.put_nowait(manager.serialize_progress(current_progress))
 
-        # Keep connection alive and handle client messages
+        # Keepalive is handled at the protocol layer (uvicorn's
+        # ws_ping_interval/ws_ping_timeout), so just wait for client
+        # messages or the disconnect
         while True:
-            try:
-                # Wait for ping or close from client
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                if data == "ping":
-                    await websocket.send_text("pong")
-            except asyncio.TimeoutError:
-                # Send keepalive
-                await websocket.send_text("ping")
+            await websocket.receive_text()
 
     except WebSocketDisconnect:
         pass
@@ -127,9 +183,9 @@ async def websocket_logs(websocket: WebSocket):
     """WebSocket endpoint for real-time log streaming."""
     await manager.connect_logs(websocket)
     try:
-        # Stream logs
+        # Stream logs; encode just the string instead of dumping a dict per line
         async for line in log_streamer.stream_logs("container"):
-            await websocket.send_text(json.dumps({"line": line}))
+            await websocket.send_text('{"line": ' + orjson.dumps(line).decode() + '}')
     except WebSocketDisconnect:
         pass
     finally:
@@ -142,7 +198,7 @@ async def websocket_logs_typed(websocket: WebSocket, log_type: str):
     await manager.connect_logs(websocket)
     try:
         async for line in log_streamer.stream_logs(log_type):
-            await websocket.send_text(json.dumps({"line": line}))
+            await websocket.send_text('{"line": ' + orjson.dumps(line).decode() + '}')
     except WebSocketDisconnect:
         pass
     finally:
@@ -1,6 +1,7 @@
 """
 File browser service for directory listing.
 """
+import asyncio
 import os
 import stat
 from datetime import datetime
@@ -17,52 +18,89 @@ class FileBrowser:
     def __init__(self):
         self.local_root = settings.local_data_path
         self.filespace_root = settings.lucidlink_mount_point
+        # The roots cannot change after startup, so resolve them once
+        # instead of paying a realpath per request
+        self._local_root_resolved = os.path.realpath(self.local_root)
+        self._filespace_root_resolved = os.path.realpath(self.filespace_root)
 
-    def _validate_path(self, path: str, root: str) -> tuple[bool, str]:
+    def _validate_path(self, path: str, root_resolved: str) -> tuple[bool, str]:
         """
         Validate that the requested path is within the allowed root.
-        Returns (is_valid, resolved_path).
+        ``root_resolved`` must already be realpath'd. Returns
+        (is_valid, resolved_path).
         """
         try:
             # Resolve to absolute path
-            resolved = os.path.realpath(os.path.join(root, path.lstrip("/")))
-            root_resolved = os.path.realpath(root)
+            resolved = os.path.realpath(os.path.join(root_resolved, path.lstrip("/")))
 
-            # Check if resolved path is within root
-            if not resolved.startswith(root_resolved):
+            # Check if resolved path is within root; commonpath avoids the
+            # startswith prefix trap (/data/foobar matching root /data/foo)
+            if os.path.commonpath([resolved, root_resolved]) != root_resolved:
                 return False, ""
 
             return True, resolved
         except Exception:
             return False, ""
 
-    def _get_file_info(self, path: str, name: str) -> Optional[FileInfo]:
-        """Get file information for a single file/directory."""
+    def _get_file_info(
+        self, entry: os.DirEntry, rel_path: str, dirs_only: bool = False
+    ) -> Optional[FileInfo]:
+        """Get file information for a single directory entry.
+
+        ``rel_path`` is the root-relative path stored on the model. The
+        DirEntry carries stat data cached from the directory enumeration,
+        so no extra syscall is paid per entry on most filesystems. Inputs
+        come straight from the stat result, so model_construct skips
+        validation. With ``dirs_only`` set, non-directories are dropped
+        before any FileInfo construction.
+        """
         try:
-            full_path = os.path.join(path, name)
-            stat_info = os.stat(full_path)
-
-            return FileInfo(
-                name=name,
-                path=full_path,
-                is_dir=stat.S_ISDIR(stat_info.st_mode),
-                size=stat_info.st_size if not stat.S_ISDIR(stat_info.st_mode) else 0,
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if dirs_only and not is_dir:
+                return None
+            stat_info = entry.stat(follow_symlinks=False)
+
+            return FileInfo.model_construct(
+                name=entry.name,
+                path=rel_path,
+                is_dir=is_dir,
+                size=stat_info.st_size if not is_dir else 0,
                 modified=datetime.fromtimestamp(stat_info.st_mtime),
                 permissions=stat.filemode(stat_info.st_mode),
             )
         except (OSError, PermissionError):
             return None
 
-    def browse_local(self, path: str = "") -> BrowseResponse:
+    def browse_local(self, path: str = "", dirs_only: bool = False) -> BrowseResponse:
         """Browse the local data directory."""
-        return self._browse(path, self.local_root, "local")
+        return self._browse(path, self._local_root_resolved, "local", dirs_only)
 
-    def browse_filespace(self, path: str = "") -> BrowseResponse:
+    def browse_filespace(self, path: str = "", dirs_only: bool = False) -> BrowseResponse:
         """Browse the LucidLink filespace directory."""
-        return self._browse(path, self.filespace_root, "filespace")
+        return self._browse(path, self._filespace_root_resolved, "filespace", dirs_only)
+
+    async def browse_local_async(
+        self, path: str = "", dirs_only: bool = False
+    ) -> BrowseResponse:
+        """Browse the local data directory without blocking the event loop."""
+        return await asyncio.to_thread(
+            self._browse, path, self._local_root_resolved, "local", dirs_only
+        )
 
-    def _browse(self, path: str, root: str, location: str) -> BrowseResponse:
-        """Internal browse implementation."""
+    async def browse_filespace_async(
+        self, path: str = "", dirs_only: bool = False
+    ) -> BrowseResponse:
+        """Browse the filespace without blocking the event loop.
+
+        Listings on the FUSE mount can stall for seconds on cold
+        directories, so the scandir walk runs on the default executor.
+        """
+        return await asyncio.to_thread(
+            self._browse, path, self._filespace_root_resolved, "filespace", dirs_only
+        )
+
+    def _browse(self, path: str, root: str, location: str, dirs_only: bool = False) -> BrowseResponse:
+        """Internal browse implementation. ``root`` must be realpath'd."""
         # Handle empty path
         if not path or path == "/":
             path = ""
@@ -102,22 +140,29 @@ class FileBrowser:
             if not parent:
                 parent = ""
 
-        # List directory contents
-        items = []
+        # List directory contents; scandir yields stat data alongside the
+        # names, avoiding an os.stat syscall per entry
+        rel_prefix = "" if relative_path == "." else relative_path + "/"
+        # Decorated (dirs-first, case-folded name, name, info) tuples so
+        # the sort compares plain tuples instead of calling a key function
+        # per FileInfo; the unique name breaks ties before the model
+        decorated = []
         try:
-            for name in sorted(os.listdir(resolved_path)):
-                # Skip hidden files starting with .lucid (internal)
-                if name.startswith(".lucid"):
-                    continue
-
-                file_info = self._get_file_info(resolved_path, name)
-                if file_info:
-                    # Make path relative to root
-                    file_info.path = os.path.relpath(file_info.path, root)
-                    items.append(file_info)
+            with os.scandir(resolved_path) as it:
+                for entry in it:
+                    name = entry.name
+                    # Skip hidden files starting with .lucid (internal)
+                    if name.startswith(".lucid"):
+                        continue
+
+                    file_info = self._get_file_info(entry, rel_prefix + name, dirs_only)
+                    if file_info:
+                        decorated.append(
+                            (not file_info.is_dir, name.lower(), name, file_info)
+                        )
 
             # Sort: directories first, then files, both alphabetically
-            items.sort(key=lambda x: (not x.is_dir, x.name.lower()))
+            decorated.sort()
 
         except PermissionError:
             return BrowseResponse(
@@ -129,7 +174,7 @@ class FileBrowser:
         return BrowseResponse(
             path=relative_path if relative_path != "." else "",
             parent=parent,
-            items=items,
+            items=[t[3] for t in decorated],
         )
 
 
@@ -1,47 +1,133 @@
 """
 Service for managing filename issues - files with problematic characters.
 """
-import json
+import asyncio
 import os
 import re
 import shutil
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 
-import aiofiles
+import orjson
+from pydantic import TypeAdapter
 
 from webapp.config import settings
 from webapp.models.sync_job import FilenameIssue, FilenameIssuesSummary
 
+# Bound once; dump_json serializes the whole list to bytes in pydantic-core
+# without per-issue model_dump dicts in between
+_ISSUES_ADAPTER = TypeAdapter(list[FilenameIssue])
+
 
 class FilenameIssuesManager:
     """Manages filename issues storage and remediation."""
 
+    _DETECTED_AT = attrgetter("detected_at")
+
     def __init__(self):
         self.issues_file = os.path.join(settings.config_path, "filename_issues.json")
         self.issues: dict[str, FilenameIssue] = {}
+        # Issues partitioned by resolution state, each kept ordered by
+        # detected_at, so list views need no per-request sort.
+        self._pending: list[FilenameIssue] = []
+        self._resolved: list[FilenameIssue] = []
+        # Secondary indices so per-job and per-status lookups don't scan
+        # the whole issues map.
+        self.by_job: dict[str, set[str]] = defaultdict(set)
+        self.by_status: dict[str, set[str]] = defaultdict(set)
+        # Persistence is debounced: save() marks dirty and a background
+        # flusher coalesces bursts of status changes into one write.
+        self._dirty = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    def _insert_sorted(self, issue: FilenameIssue):
+        """Register an issue in the partition and indices for its status."""
+        target = self._pending if issue.status == "pending" else self._resolved
+        insort(target, issue, key=self._DETECTED_AT)
+        self.by_job[issue.job_id].add(issue.id)
+        self.by_status[issue.status].add(issue.id)
+
+    def _mark_resolved(self, issue: FilenameIssue):
+        """Move an issue from the pending partition to the resolved one.
+
+        Called after ``issue.status`` has been set to its resolved value.
+        """
+        try:
+            self._pending.remove(issue)
+        except ValueError:
+            pass
+        self.by_status["pending"].discard(issue.id)
+        self.by_status[issue.status].add(issue.id)
+        insort(self._resolved, issue, key=self._DETECTED_AT)
+
+    def get_issues_sorted(self) -> list[FilenameIssue]:
+        """All issues, pending first, newest first within each group."""
+        return self._pending[::-1] + self._resolved[::-1]
 
     async def load(self):
         """Load issues from persistence file."""
         if os.path.exists(self.issues_file):
+            def _read() -> bytes:
+                with open(self.issues_file, "rb") as f:
+                    return f.read()
+
             try:
-                async with aiofiles.open(self.issues_file, "r") as f:
-                    data = json.loads(await f.read())
-                    for issue_data in data.get("issues", []):
-                        issue = FilenameIssue(**issue_data)
-                        self.issues[issue.id] = issue
+                data = orjson.loads(await asyncio.to_thread(_read))
+                # Current format is a bare list; the legacy format
+                # wrapped it in {"issues": [...]}
+                items = data if isinstance(data, list) else data.get("issues", [])
+                for issue in _ISSUES_ADAPTER.validate_python(items):
+                    self.issues[issue.id] = issue
+                    self._insert_sorted(issue)
             except Exception as e:
                 print(f"Error loading filename issues: {e}")
 
     async def save(self):
-        """Persist issues to file."""
+        """Schedule a persistence write.
+
+        Writes are debounced: bursts of status changes within the
+        coalescing window land in a single file write.
+        """
+        self._dirty.set()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def flush(self):
+        """Stop the flusher and write any pending changes immediately."""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        if self._dirty.is_set():
+            self._dirty.clear()
+            await self._do_save()
+
+    async def _flush_loop(self):
+        while True:
+            await self._dirty.wait()
+            # Let a burst of changes accumulate before writing
+            await asyncio.sleep(0.2)
+            self._dirty.clear()
+            await self._do_save()
+
+    async def _do_save(self):
+        """Persist issues to file atomically (temp file + rename)."""
         os.makedirs(os.path.dirname(self.issues_file), exist_ok=True)
         try:
-            data = {
-                "issues": [issue.model_dump() for issue in self.issues.values()]
-            }
-            async with aiofiles.open(self.issues_file, "w") as f:
-                await f.write(json.dumps(data, indent=2, default=str))
+            # Serialize straight to bytes in pydantic-core; no per-issue
+            # model_dump dicts and no separate json encode pass
+            payload = _ISSUES_ADAPTER.dump_json(list(self.issues.values()), indent=2)
+            tmp_file = self.issues_file + ".tmp"
+
+            def _write():
+                with open(tmp_file, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.issues_file)
+
+            # Write and rename in one thread dispatch
+            await asyncio.to_thread(_write)
         except Exception as e:
             print(f"Error saving filename issues: {e}")
 
@@ -58,16 +144,28 @@ class FilenameIssuesManager:
         '\x00': '',
     }
 
+    # str.translate table built once; one C-level pass applies the
+    # CHAR_REPLACEMENTS map and deletes all control characters (mapping
+    # to None deletes), so no Python-level character loop is needed
+    _TRANS = str.maketrans(
+        {**{ord(k): v for k, v in CHAR_REPLACEMENTS.items()},
+         **{i: None for i in range(32)}}
+    )
+
+    # Matches anything normalize_filename would change: problematic or
+    # control characters, or leading/trailing space / trailing dot
+    _NEEDS_NORM = re.compile(r'[\x00-\x1f\\:*?"<>|]|^ |[ .]$')
+
     def normalize_filename(self, name: str) -> str:
         """Generate a normalized filename by replacing problematic characters."""
-        result = name
-
-        # Replace known problematic characters
-        for char, replacement in self.CHAR_REPLACEMENTS.items():
-            result = result.replace(char, replacement)
+        # Fast path: most names are already clean, so skip the whole
+        # translate/strip/encode pipeline for them
+        if not self._NEEDS_NORM.search(name) and len(name.encode('utf-8')) <= 255:
+            return name
 
-        # Remove control characters
-        result = ''.join(c for c in result if ord(c) >= 32)
+        # Replace known problematic characters and strip control
+        # characters in the same pass
+        result = name.translate(self._TRANS)
 
         # Remove leading and trailing spaces, and trailing dots
         result = result.strip(' ')  # Remove leading/trailing spaces
@@ -77,12 +175,13 @@ class FilenameIssuesManager:
         if not result:
             result = "_renamed_"
 
-        # Truncate if too long (preserve extension)
+        # Truncate if too long (preserve extension); slice the encoded
+        # bytes once and drop any split multi-byte sequence on decode
+        # instead of re-encoding the base one character at a time
         if len(result.encode('utf-8')) > 255:
             base, ext = os.path.splitext(result)
             max_base = 255 - len(ext.encode('utf-8')) - 1
-            while len(base.encode('utf-8')) > max_base:
-                base = base[:-1]
+            base = base.encode('utf-8')[:max_base].decode('utf-8', errors='ignore')
             result = base + ext
 
         return result
@@ -115,41 +214,85 @@ class FilenameIssuesManager:
         )
 
         self.issues[issue.id] = issue
+        self._insert_sorted(issue)
         return issue
 
+    async def add_issues_bulk(
+        self,
+        job_id: str,
+        job_name: str,
+        source_base: str,
+        issues: list[tuple],
+    ) -> int:
+        """Add many issues in one call (no per-issue await round-trips).
+
+        ``issues`` holds (relative_path, filename, is_dir, issue_type,
+        issue_char) tuples as produced by the preflight walk. The caller
+        persists once afterwards via save().
+        """
+        for relative_path, filename, is_dir, issue_type, issue_char in issues:
+            suggested_name = self.normalize_filename(filename)
+            issue = FilenameIssue(
+                job_id=job_id,
+                job_name=job_name,
+                source_path=os.path.join(source_base, relative_path),
+                relative_path=relative_path,
+                filename=filename,
+                is_dir=is_dir,
+                issue_type=issue_type,
+                issue_char=issue_char,
+                suggested_name=suggested_name if suggested_name != filename else None,
+            )
+            self.issues[issue.id] = issue
+            self._insert_sorted(issue)
+        return len(issues)
+
     async def clear_job_issues(self, job_id: str):
         """Clear all issues for a specific job (before re-scan)."""
-        to_remove = [id for id, issue in self.issues.items() if issue.job_id == job_id]
-        for id in to_remove:
-            del self.issues[id]
+        for id in self.by_job.pop(job_id, set()):
+            issue = self.issues.pop(id, None)
+            if issue:
+                self.by_status[issue.status].discard(id)
+        self._pending = [i for i in self._pending if i.job_id != job_id]
+        self._resolved = [i for i in self._resolved if i.job_id != job_id]
 
     def get_issues_for_job(self, job_id: str) -> list[FilenameIssue]:
         """Get all issues for a specific job."""
-        return [issue for issue in self.issues.values() if issue.job_id == job_id]
+        return [self.issues[id] for id in self.by_job.get(job_id, ())]
 
     def get_summary_for_job(self, job_id: str) -> FilenameIssuesSummary:
         """Get summary of issues for a job."""
-        issues = self.get_issues_for_job(job_id)
+        job_ids = self.by_job.get(job_id, set())
         return FilenameIssuesSummary(
             job_id=job_id,
-            total_issues=len(issues),
-            pending=sum(1 for i in issues if i.status == "pending"),
-            renamed=sum(1 for i in issues if i.status == "renamed"),
-            skipped=sum(1 for i in issues if i.status == "skipped"),
-            failed=sum(1 for i in issues if i.status == "failed"),
-            issues=issues,
+            total_issues=len(job_ids),
+            pending=len(job_ids & self.by_status["pending"]),
+            renamed=len(job_ids & self.by_status["renamed"]),
+            skipped=len(job_ids & self.by_status["skipped"]),
+            failed=len(job_ids & self.by_status["failed"]),
+            issues=[self.issues[id] for id in job_ids],
         )
 
     def get_all_pending(self) -> list[FilenameIssue]:
         """Get all pending issues across all jobs."""
-        return [issue for issue in self.issues.values() if issue.status == "pending"]
+        return [self.issues[id] for id in self.by_status.get("pending", ())]
 
     async def rename_file(self, issue_id: str, new_name: Optional[str] = None) -> tuple[bool, str]:
-        """Rename a file to fix the issue."""
+        """Rename a file to fix the issue and persist the result."""
         issue = self.issues.get(issue_id)
         if not issue:
             return False, "Issue not found"
 
+        status_before = issue.status
+        result = await self._rename_file_nosave(issue, new_name)
+        if issue.status != status_before:
+            await self.save()
+        return result
+
+    async def _rename_file_nosave(
+        self, issue: FilenameIssue, new_name: Optional[str] = None
+    ) -> tuple[bool, str]:
+        """Rename a file without persisting; callers batch the save."""
         if issue.status != "pending":
             return False, f"Issue already resolved: {issue.status}"
 
@@ -165,26 +308,38 @@ class FilenameIssuesManager:
         parent_dir = os.path.dirname(issue.source_path)
         new_path = os.path.join(parent_dir, target_name)
 
-        # Check if target already exists
-        if os.path.exists(new_path):
-            return False, f"Target already exists: {new_path}"
-
         try:
-            # Rename the file/directory
-            shutil.move(issue.source_path, new_path)
+            # Check and rename off the event loop; os.path.exists can
+            # stall on the FUSE mount just like the move itself
+            await asyncio.to_thread(self._move_checked, issue.source_path, new_path)
 
             # Update issue status
             issue.status = "renamed"
             issue.resolved_at = datetime.utcnow()
-            await self.save()
+            self._mark_resolved(issue)
 
             return True, f"Renamed to: {target_name}"
 
+        except FileExistsError:
+            # Leave the issue pending; a different target name can still fix it
+            return False, f"Target already exists: {new_path}"
         except Exception as e:
             issue.status = "failed"
-            await self.save()
+            self._mark_resolved(issue)
             return False, f"Rename failed: {e}"
 
+    @staticmethod
+    def _move_checked(source_path: str, new_path: str):
+        """Move source to new_path, refusing to overwrite an existing target.
+
+        Runs in a worker thread; the exists check and the move share the
+        same thread hop. The check-then-move race is accepted and
+        surfaces as an OSError from the move.
+        """
+        if os.path.exists(new_path):
+            raise FileExistsError(new_path)
+        shutil.move(source_path, new_path)
+
     async def skip_issue(self, issue_id: str) -> tuple[bool, str]:
         """Mark an issue as skipped (won't be renamed)."""
         issue = self.issues.get(issue_id)
@@ -193,6 +348,7 @@ class FilenameIssuesManager:
 
         issue.status = "skipped"
         issue.resolved_at = datetime.utcnow()
+        self._mark_resolved(issue)
         await self.save()
         return True, "Issue marked as skipped"
 
@@ -210,8 +366,24 @@ class FilenameIssuesManager:
             "errors": [],
         }
 
-        for issue in pending:
-            success, message = await self.rename_file(issue.id)
+        # Bounded fan-out; persist once at the end instead of rewriting
+        # the issues file per rename
+        sem = asyncio.Semaphore(16)
+
+        async def _one(issue: FilenameIssue) -> tuple[bool, str]:
+            async with sem:
+                return await self._rename_file_nosave(issue)
+
+        outcomes = await asyncio.gather(
+            *(_one(issue) for issue in pending), return_exceptions=True
+        )
+        await self.save()
+
+        for issue, outcome in zip(pending, outcomes):
+            if isinstance(outcome, Exception):
+                success, message = False, str(outcome)
+            else:
+                success, message = outcome
             if success:
                 results["renamed"] += 1
             else:
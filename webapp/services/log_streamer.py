@@ -3,15 +3,19 @@ Log streaming service for real-time log viewing.
 """
 import asyncio
 import os
+from collections import defaultdict
 from typing import AsyncGenerator, Optional
 
-import aiofiles
-
 from webapp.config import settings
 
 
 class LogStreamer:
-    """Service for streaming log files."""
+    """Service for streaming log files.
+
+    Each log file is tailed by at most one background task regardless of
+    how many WebSocket clients are watching it; the tailer pushes lines
+    into a per-subscriber queue and stops when the last subscriber leaves.
+    """
 
     def __init__(self):
         self.log_files = {
@@ -19,6 +23,8 @@ class LogStreamer:
             "sync": os.path.join(settings.log_path, "sync.log"),
             "errors": os.path.join(settings.log_path, "errors.log"),
         }
+        self.subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self.tailer_tasks: dict[str, asyncio.Task] = {}
 
     async def get_logs(
         self,
@@ -30,41 +36,101 @@ class LogStreamer:
         if not log_file or not os.path.exists(log_file):
             return []
 
+        def _read() -> str:
+            with open(log_file, "r") as f:
+                return f.read()
+
         try:
-            async with aiofiles.open(log_file, "r") as f:
-                content = await f.read()
-                all_lines = content.strip().split("\n")
-                return all_lines[-lines:] if lines > 0 else all_lines
+            # One thread dispatch for open+read+close
+            content = await asyncio.to_thread(_read)
+            all_lines = content.strip().split("\n")
+            return all_lines[-lines:] if lines > 0 else all_lines
         except Exception as e:
             return [f"Error reading log: {e}"]
 
+    def subscribe(self, log_type: str) -> asyncio.Queue:
+        """Register a subscriber queue, lazily starting the shared tailer."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers[log_type].add(queue)
+        task = self.tailer_tasks.get(log_type)
+        if task is None or task.done():
+            self.tailer_tasks[log_type] = asyncio.create_task(self._tail(log_type))
+        return queue
+
+    def unsubscribe(self, log_type: str, queue: asyncio.Queue):
+        """Remove a subscriber; stop the tailer when nobody is left."""
+        self.subscribers[log_type].discard(queue)
+        if not self.subscribers[log_type]:
+            task = self.tailer_tasks.pop(log_type, None)
+            if task and not task.done():
+                task.cancel()
+
+    async def _tail(self, log_type: str):
+        """Tail one log file and fan lines out to all subscriber queues.
+
+        Reads 64 KiB chunks from a raw fd via one executor hop, so bursts
+        of log output cost one read instead of one readline per line.
+        (epoll can't watch regular files, so an add_reader/inotify-style
+        wakeup isn't available here; EOF is polled instead.) Rotation is
+        detected by comparing inodes every few seconds at EOF.
+        """
+        log_file = self.log_files[log_type]
+
+        # Wait for file to exist
+        while not os.path.exists(log_file):
+            await asyncio.sleep(1)
+
+        fd = os.open(log_file, os.O_RDONLY)
+        try:
+            os.lseek(fd, 0, os.SEEK_END)
+            buffer = b""
+            loop = asyncio.get_running_loop()
+            last_rotation_check = loop.time()
+            while True:
+                data = await asyncio.to_thread(os.read, fd, 65536)
+                if data:
+                    buffer += data
+                    if b"\n" in buffer:
+                        *lines, buffer = buffer.split(b"\n")
+                        for raw in lines:
+                            line = raw.decode("utf-8", errors="replace").rstrip()
+                            for queue in self.subscribers[log_type]:
+                                queue.put_nowait(line)
+                else:
+                    await asyncio.sleep(0.5)
+                    now = loop.time()
+                    if now - last_rotation_check >= 5.0:
+                        last_rotation_check = now
+                        try:
+                            if os.stat(log_file).st_ino != os.fstat(fd).st_ino:
+                                os.close(fd)
+                                fd = os.open(log_file, os.O_RDONLY)
+                                buffer = b""
+                        except FileNotFoundError:
+                            pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            for queue in self.subscribers[log_type]:
+                queue.put_nowait(f"Error streaming log: {e}")
+        finally:
+            os.close(fd)
+
     async def stream_logs(
         self,
         log_type: str = "container",
     ) -> AsyncGenerator[str, None]:
         """Stream log file changes in real-time (tail -f style)."""
-        log_file = self.log_files.get(log_type)
-        if not log_file:
+        if log_type not in self.log_files:
             yield f"Unknown log type: {log_type}"
             return
 
-        # Wait for file to exist
-        while not os.path.exists(log_file):
-            await asyncio.sleep(1)
-
+        queue = self.subscribe(log_type)
         try:
-            async with aiofiles.open(log_file, "r") as f:
-                # Seek to end
-                await f.seek(0, 2)
-
-                while True:
-                    line = await f.readline()
-                    if line:
-                        yield line.rstrip()
-                    else:
-                        await asyncio.sleep(0.5)
-        except Exception as e:
-            yield f"Error streaming log: {e}"
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(log_type, queue)
 
     def get_available_logs(self) -> list[dict]:
         """Get list of available log files with metadata."""
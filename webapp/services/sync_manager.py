@@ -2,15 +2,24 @@
 Sync job manager service.
 """
 import asyncio
-import json
+import ctypes
+import fcntl
+import fnmatch
+import heapq
 import os
+import queue
 import re
 import shutil
+import signal
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-import aiofiles
+import orjson
+from pydantic import TypeAdapter
 
 from webapp.config import settings
 from webapp.models.sync_job import (
@@ -25,6 +34,31 @@ from webapp.models.sync_job import (
     FilenameIssue,
 )
 
+# One C-level validation pass for the whole jobs list on load, instead of
+# a Python-level SyncJob(**data) per record
+_JOBS_ADAPTER = TypeAdapter(list[SyncJob])
+
+_PR_SET_PDEATHSIG = 1  # linux/prctl.h
+
+# Resolved at import: dlopen between fork and exec can deadlock on the
+# glibc loader lock in a threaded process, so the preexec hook must only
+# make the raw prctl call
+try:
+    _LIBC = ctypes.CDLL("libc.so.6", use_errno=True)
+except OSError:
+    _LIBC = None
+
+
+def _worker_preexec():
+    """Runs in the forked child just before exec'ing rsync.
+
+    PR_SET_PDEATHSIG makes the kernel SIGTERM the rsync if this process
+    dies without running its cleanup, so a crashed event loop can't
+    leave orphaned rsyncs hammering the mount.
+    """
+    if _LIBC is not None:
+        _LIBC.prctl(_PR_SET_PDEATHSIG, signal.SIGTERM, 0, 0, 0)
+
 
 class SyncManager:
     """Manages sync jobs including CRUD, execution, and progress tracking."""
@@ -34,67 +68,162 @@ class SyncManager:
         self.running_processes: dict[str, asyncio.subprocess.Process] = {}
         self.running_tasks: dict[str, list[asyncio.Task]] = {}  # Track worker tasks
         self.worker_processes: dict[str, list[asyncio.subprocess.Process]] = {}  # Track worker subprocesses
-        self.stop_requested: dict[str, bool] = {}  # Track stop requests
+        self.stop_requested: dict[str, asyncio.Event] = {}  # Per-job stop signal
         self.progress: dict[str, SyncProgress] = {}
         self._progress_callbacks: list = []
+        # callback -> its bounded queue / dispatcher task (see _notify_progress)
+        self._progress_queues: dict = {}
+        self._dispatch_tasks: dict = {}
+        # job_id -> serialized JSON fragment; save_jobs re-serializes only
+        # jobs whose entry was invalidated via _mark_dirty, so a
+        # single-job mutation doesn't pay a model_dump per stored job
+        self._job_json_cache: dict[str, bytes] = {}
+        # path -> (monotonic timestamp, is_healthy, error); see _check_mount_health
+        self._last_health_check: dict[str, tuple[float, bool, str]] = {}
+        # job_id -> latest unsent snapshot / flusher task / last-sent state;
+        # see _schedule_notify
+        self._pending_progress: dict[str, SyncProgress] = {}
+        self._notify_flushers: dict[str, asyncio.Task] = {}
+        self._last_sent_progress: dict[str, tuple] = {}
+        # Debounced persistence; see save_jobs
+        self._save_requested = asyncio.Event()
+        self._save_task: Optional[asyncio.Task] = None
+        # (checked_at, connected) for the /proc/mounts scan in
+        # get_system_status; same TTL pattern as _check_mount_health
+        self._mounts_cache: tuple[float, bool] = (0.0, False)
+        # Dedicated pool for preflight tree scans: the walks are pure
+        # syscall work (GIL released), and a private pool keeps a big
+        # preflight from starving the default executor that saves and
+        # log reads run on. Its size doubles as the concurrency bound.
+        self._scan_executor = ThreadPoolExecutor(
+            max_workers=self._PREFLIGHT_CONCURRENCY,
+            thread_name_prefix="preflight-scan",
+        )
 
-    async def load_jobs(self):
-        """Load jobs from persistence file."""
+    def _load_jobs_sync(self) -> Optional[tuple[str, dict]]:
+        """Read and parse the jobs file (blocking; runs in a thread).
+
+        Tries the main file first, then the backup. Returns
+        (filepath, parsed data) or None if neither could be read.
+        """
         backup_file = settings.jobs_file + ".backup"
 
-        # Try main file first, then backup
         for filepath in [settings.jobs_file, backup_file]:
             if not os.path.exists(filepath):
                 continue
             try:
-                async with aiofiles.open(filepath, "r") as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                    for job_data in data.get("jobs", []):
-                        job = SyncJob(**job_data)
-                        # Reset status on load (container restart)
-                        job.status = JobStatus.IDLE
-                        self.jobs[job.id] = job
-                    print(f"Loaded {len(self.jobs)} jobs from {filepath}")
-                    return  # Success
-            except json.JSONDecodeError as e:
+                with open(filepath, "rb") as f:
+                    content = f.read()
+                return filepath, orjson.loads(content)
+            except orjson.JSONDecodeError as e:
                 print(f"JSON error loading {filepath}: {e}")
                 # Save corrupted file for debugging
                 if filepath == settings.jobs_file:
                     corrupt_file = settings.jobs_file + ".corrupted"
                     try:
-                        async with aiofiles.open(corrupt_file, "w") as f:
-                            await f.write(content)
+                        with open(corrupt_file, "wb") as f:
+                            f.write(content)
                         print(f"Saved corrupted file to {corrupt_file}")
                     except Exception:
                         pass
             except Exception as e:
                 print(f"Error loading {filepath}: {e}")
+        return None
+
+    async def load_jobs(self):
+        """Load jobs from persistence file."""
+        # One thread dispatch for the whole read+parse instead of a
+        # threadpool round-trip per file operation
+        result = await asyncio.to_thread(self._load_jobs_sync)
+        if not result:
+            return
+
+        filepath, data = result
+        jobs = _JOBS_ADAPTER.validate_python(data.get("jobs", []))
+        for job in jobs:
+            # Reset status on load (container restart)
+            job.status = JobStatus.IDLE
+        self.jobs = {job.id: job for job in jobs}
+        print(f"Loaded {len(self.jobs)} jobs from {filepath}")
+
+    @staticmethod
+    def _save_jobs_sync(path: str, json_content: bytes):
+        """Write the jobs file atomically (blocking; runs in a thread)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Create backup of existing file
+        if os.path.exists(path):
+            try:
+                shutil.copy2(path, path + ".backup")
+            except Exception as e:
+                print(f"Warning: Could not create backup: {e}")
+
+        # Atomic write: write to temp file, fsync, then rename. Without
+        # the fsync a crash can leave a zero-length file behind the
+        # rename; the directory fsync persists the rename itself. A raw
+        # fd skips the BufferedWriter copy of the serialized bytes.
+        temp_file = path + ".tmp"
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(json_content)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_file, path)
+        dir_fd = os.open(os.path.dirname(path), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _mark_dirty(self, job_id: str):
+        """Invalidate the serialized fragment for a mutated job.
+
+        Every code path that mutates a SyncJob must call this before
+        save_jobs, or the stale cached fragment gets persisted.
+        """
+        self._job_json_cache.pop(job_id, None)
+
+    # How long to sit on a save request waiting for more mutations to
+    # coalesce into the same write
+    _SAVE_DEBOUNCE = 0.5
 
     async def save_jobs(self):
-        """Persist jobs to file with atomic write and backup."""
-        # Ensure config directory exists
-        os.makedirs(os.path.dirname(settings.jobs_file), exist_ok=True)
+        """Request a persist of the jobs file (debounced).
 
+        Mutations arrive in bursts — a finishing run updates status,
+        stats and counters through several call sites — so instead of
+        serializing and fsyncing per call, flag the state dirty and let
+        one background task write the burst as a single save shortly
+        after.
+        """
+        self._save_requested.set()
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_loop())
+
+    async def _save_loop(self):
+        """Coalesce save requests, then write once per quiet period."""
+        while self._save_requested.is_set():
+            self._save_requested.clear()
+            await asyncio.sleep(self._SAVE_DEBOUNCE)
+            await self._write_jobs()
+
+    async def _write_jobs(self):
+        """Persist jobs to file with atomic write and backup."""
         try:
-            data = {
-                "jobs": [job.model_dump() for job in self.jobs.values()]
-            }
-            json_content = json.dumps(data, indent=2, default=str)
-
-            # Create backup of existing file
-            if os.path.exists(settings.jobs_file):
-                backup_file = settings.jobs_file + ".backup"
-                try:
-                    shutil.copy2(settings.jobs_file, backup_file)
-                except Exception as e:
-                    print(f"Warning: Could not create backup: {e}")
-
-            # Atomic write: write to temp file, then rename
-            temp_file = settings.jobs_file + ".tmp"
-            async with aiofiles.open(temp_file, "w") as f:
-                await f.write(json_content)
-            os.replace(temp_file, settings.jobs_file)
+            cache = self._job_json_cache
+            fragments = []
+            for job_id, job in self.jobs.items():
+                fragment = cache.get(job_id)
+                if fragment is None:
+                    # orjson serializes datetimes natively, no default=str
+                    fragment = cache[job_id] = orjson.dumps(job.model_dump())
+                fragments.append(fragment)
+            json_content = b'{"jobs": [' + b', '.join(fragments) + b']}'
+            # Backup, write and rename all happen in one thread dispatch
+            await asyncio.to_thread(self._save_jobs_sync, settings.jobs_file, json_content)
         except Exception as e:
             print(f"Error saving jobs: {e}")
 
@@ -106,30 +235,146 @@ class SyncManager:
         """Unregister a progress callback."""
         if callback in self._progress_callbacks:
             self._progress_callbacks.remove(callback)
+        queue = self._progress_queues.pop(callback, None)
+        if queue is not None:
+            task = self._dispatch_tasks.pop(callback, None)
+            if task and not task.done():
+                task.cancel()
 
     async def _notify_progress(self, job_id: str, progress: SyncProgress):
-        """Notify all registered callbacks of progress update."""
+        """Fan a progress update out to all registered callbacks.
+
+        Each callback gets its own bounded queue drained by a dispatcher
+        task, so workers never await a consumer: a slow WebSocket client
+        delays only its own queue. Progress is keep-latest, so when a
+        queue fills the oldest tick is dropped rather than blocking.
+        """
         for callback in self._progress_callbacks:
+            queue = self._progress_queues.get(callback)
+            if queue is None:
+                # Lazily started here so registration can happen at import
+                # time, before any event loop exists
+                queue = self._progress_queues[callback] = asyncio.Queue(maxsize=64)
+                self._dispatch_tasks[callback] = asyncio.create_task(
+                    self._dispatch_progress(callback, queue)
+                )
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait((job_id, progress))
+
+    async def _dispatch_progress(self, callback, queue: asyncio.Queue):
+        """Drain one callback's queue; errors never propagate to workers."""
+        while True:
+            job_id, progress = await queue.get()
             try:
                 await callback(job_id, progress)
             except Exception as e:
                 print(f"Error in progress callback: {e}")
 
+    # Coalescing knobs for scheduled progress pushes: at most one
+    # notification per interval per job, and only when something a client
+    # can see actually moved
+    _NOTIFY_INTERVAL = 0.2
+    _NOTIFY_MIN_BYTES = 1024 * 1024
+    _NOTIFY_MIN_PERCENT = 0.5
+
+    def _schedule_notify(self, job_id: str, progress: SyncProgress):
+        """Queue a progress push; the per-job flusher coalesces bursts.
+
+        Hot paths call this instead of awaiting _notify_progress: the
+        latest snapshot wins, and at most ~1/interval notifications leave
+        per job no matter how many workers are reporting.
+        """
+        if not self._progress_callbacks:
+            # Nobody is listening (headless run, or every WebSocket
+            # client gone): skip the snapshot bookkeeping and flusher
+            # entirely. The counters themselves stay correct.
+            return
+        self._pending_progress[job_id] = progress
+        task = self._notify_flushers.get(job_id)
+        if task is None or task.done():
+            self._notify_flushers[job_id] = asyncio.create_task(
+                self._progress_flusher(job_id)
+            )
+
+    async def _progress_flusher(self, job_id: str):
+        """Drain scheduled snapshots for one job at the notify interval."""
+        while True:
+            progress = self._pending_progress.pop(job_id, None)
+            if progress is None:
+                return
+            if self._progress_changed(job_id, progress):
+                now = time.monotonic()
+                last = self._last_sent_progress.get(job_id)
+                if last is not None and progress.bytes_transferred > last[3] and now > last[5]:
+                    # Derive the rate from our own byte deltas; the
+                    # per-file worker output has no rate field
+                    rate = (progress.bytes_transferred - last[3]) / (now - last[5])
+                    progress.transfer_rate = f"{rate / 1_000_000:.2f}MB/s"
+                self._last_sent_progress[job_id] = (
+                    progress.status,
+                    progress.current_file,
+                    progress.files_transferred,
+                    progress.bytes_transferred,
+                    progress.percent_complete,
+                    now,
+                )
+                # Timestamp once per emission, not per progress line
+                progress.updated_at = datetime.utcnow()
+                await self._notify_progress(job_id, progress)
+            await asyncio.sleep(self._NOTIFY_INTERVAL)
+
+    def _progress_changed(self, job_id: str, progress: SyncProgress) -> bool:
+        """True when a snapshot differs enough from the last one sent."""
+        last = self._last_sent_progress.get(job_id)
+        if last is None:
+            return True
+        status, current_file, files_sent, bytes_sent, percent, _ = last
+        if (
+            progress.status != status
+            or progress.current_file != current_file
+            or progress.files_transferred != files_sent
+        ):
+            return True
+        return (
+            abs(progress.bytes_transferred - bytes_sent) >= self._NOTIFY_MIN_BYTES
+            or abs(progress.percent_complete - percent) >= self._NOTIFY_MIN_PERCENT
+        )
+
+    # How long a health probe result stays valid; callers in hot paths hit
+    # the cache instead of the FUSE mount
+    _HEALTH_CHECK_TTL = 2.0
+
     def _check_mount_health(self, path: str) -> tuple[bool, str]:
         """Check if a mount point is healthy and accessible.
 
         Returns (is_healthy, error_message).
         Disconnected FUSE mounts return errno 107 immediately, no timeout needed.
+        Results are cached per path for _HEALTH_CHECK_TTL seconds so
+        per-batch callers don't hammer the mount with probes.
         """
+        now = time.monotonic()
+        cached = self._last_health_check.get(path)
+        if cached is not None and now - cached[0] < self._HEALTH_CHECK_TTL:
+            return cached[1], cached[2]
+
+        result = self._probe_mount_health(path)
+        self._last_health_check[path] = (now, result[0], result[1])
+        return result
+
+    @staticmethod
+    def _probe_mount_health(path: str) -> tuple[bool, str]:
+        """Probe a mount point directly, bypassing the TTL cache."""
         try:
-            # Quick check: can we stat the path?
-            if not os.path.exists(path):
-                return False, f"Path does not exist: {path}"
-
-            # Try to list the directory - disconnected mounts fail immediately with errno 107
-            os.listdir(path)
+            # Open the directory without reading its entries: disconnected
+            # mounts fail immediately with errno 107, and unlike listdir
+            # this never materializes the directory contents over FUSE
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            os.close(dir_fd)
             return True, ""
 
+        except FileNotFoundError:
+            return False, f"Path does not exist: {path}"
         except OSError as e:
             # Error 107 = Transport endpoint is not connected
             if e.errno == 107:
@@ -158,6 +403,10 @@ class SyncManager:
         """Get a job by ID."""
         return self.jobs.get(job_id)
 
+    def has_job(self, job_id: str) -> bool:
+        """O(1) existence check without touching job storage."""
+        return job_id in self.jobs
+
     async def list_jobs(self) -> list[SyncJob]:
         """List all jobs."""
         return list(self.jobs.values())
@@ -173,6 +422,7 @@ class SyncManager:
             setattr(job, field, value)
 
         job.updated_at = datetime.utcnow()
+        self._mark_dirty(job_id)
         await self.save_jobs()
         return job
 
@@ -184,6 +434,7 @@ class SyncManager:
                 await self.stop_job(job_id)
 
             del self.jobs[job_id]
+            self._mark_dirty(job_id)
             await self.save_jobs()
             return True
         return False
@@ -209,16 +460,18 @@ class SyncManager:
             return False, f"Source path not accessible: {source_error}"
 
         # Initialize progress
+        now = datetime.utcnow()
         progress = SyncProgress(
             job_id=job_id,
             status=JobStatus.RUNNING,
-            started_at=datetime.utcnow(),
+            started_at=now,
         )
         self.progress[job_id] = progress
 
         # Update job status
         job.status = JobStatus.RUNNING
-        job.last_run_at = datetime.utcnow()
+        job.last_run_at = now
+        self._mark_dirty(job_id)
         await self.save_jobs()
 
         # Start the sync process
@@ -231,8 +484,9 @@ class SyncManager:
         if job_id not in self.running_processes:
             return False, "Job is not running"
 
-        # Signal stop request
-        self.stop_requested[job_id] = True
+        # Signal stop request; workers block on this event alongside their
+        # rsync streams, so they react without polling
+        self.stop_requested.setdefault(job_id, asyncio.Event()).set()
 
         # Update progress to show stopping
         if job_id in self.progress:
@@ -243,12 +497,12 @@ class SyncManager:
             await self._notify_progress(job_id, self.progress[job_id])
 
         try:
-            # Terminate all worker subprocesses
+            # Terminate all worker subprocess groups
             if job_id in self.worker_processes:
                 for proc in self.worker_processes[job_id]:
                     try:
                         if proc.returncode is None:  # Still running
-                            proc.terminate()
+                            self._signal_worker(proc)
                     except Exception:
                         pass
 
@@ -258,7 +512,7 @@ class SyncManager:
                         await asyncio.wait_for(proc.wait(), timeout=5.0)
                     except asyncio.TimeoutError:
                         try:
-                            proc.kill()
+                            self._signal_worker(proc, signal.SIGKILL)
                         except Exception:
                             pass
 
@@ -289,6 +543,7 @@ class SyncManager:
             job.status = JobStatus.STOPPED
             job.last_run_status = JobStatus.STOPPED
             job.last_run_message = "Stopped by user"
+            self._mark_dirty(job_id)
             await self.save_jobs()
 
         if job_id in self.progress:
@@ -319,19 +574,24 @@ class SyncManager:
         if not os.path.exists(source):
             return False, f"Source path does not exist: {source}"
 
-        # Get source stats
-        total_files, total_bytes = self._get_source_stats(source, job.exclude_patterns)
-
-        # Check for filename issues
-        issue_count = await self._preflight_check_filenames(
-            job_id, job.name, source, job.exclude_patterns
+        # One fused walk: source stats and filename issues (no dest dirs
+        # on a dry run)
+        items, issue_count, _ = await self._preflight_combined(
+            job_id, job.name, source, None, job.exclude_patterns
         )
+        total_files = sum(item[1] for item in items)
+        total_bytes = sum(item[2] for item in items)
 
         # Build rsync command with --dry-run and itemize
         rsync_opts = job.rsync_options.split()
-        # Add dry-run and itemize flags
-        rsync_opts = [opt for opt in rsync_opts if opt not in ['--dry-run', '-n', '--itemize-changes', '-i']]
-        rsync_opts.extend(['--dry-run', '--itemize-changes'])
+        # Add dry-run and itemize flags; %l puts the file size on the line
+        # so parsing needs no stat per file
+        rsync_opts = [
+            opt for opt in rsync_opts
+            if opt not in ['--dry-run', '-n', '--itemize-changes', '-i']
+            and not opt.startswith('--out-format')
+        ]
+        rsync_opts.extend(['--dry-run', '--out-format=%i %l %n'])
         for pattern in job.exclude_patterns:
             rsync_opts.extend(["--exclude", pattern])
 
@@ -340,6 +600,8 @@ class SyncManager:
         files_to_transfer = []
         errors = []
         bytes_to_transfer = 0
+        transfer_count = 0
+        delete_count = 0
 
         try:
             process = await asyncio.create_subprocess_exec(
@@ -348,55 +610,67 @@ class SyncManager:
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            stdout, stderr = await process.communicate()
-
-            # Parse stdout for file list
-            # rsync --itemize-changes output format:
-            # >f+++++++++ path/to/file (new file to transfer)
-            # >f.st...... path/to/file (file to update)
-            # cd+++++++++ path/to/dir/ (new directory)
-            # *deleting   path/to/file (file to delete)
-            for line in stdout.decode().split('\n'):
-                line = line.strip()
+            # Drain stderr concurrently so a full stderr pipe can't
+            # deadlock the stdout loop
+            stderr_task = asyncio.create_task(process.stderr.read())
+
+            # Stream stdout line-by-line instead of buffering the whole
+            # itemized listing: memory stays constant however large the
+            # tree is, and parsing overlaps the rsync scan. Only the first
+            # 500 entries are kept as DryRunFile objects; the rest just
+            # update the tallies.
+            # --out-format="%i %l %n" output:
+            # >f+++++++++ 1234 path/to/file (new file to transfer)
+            # >f.st...... 1234 path/to/file (file to update)
+            # cd+++++++++ 4096 path/to/dir/ (new directory)
+            # *deleting   1234 path/to/file (file to delete)
+            async for raw in process.stdout:
+                line = raw.decode().strip()
                 if not line:
                     continue
 
                 # Parse itemize format
                 if len(line) > 11 and line[0] in '>c*':
-                    action_code = line[:11]
-                    filepath = line[12:] if len(line) > 12 else ""
-
-                    if not filepath:
+                    parts = line.split(None, 2)
+                    if len(parts) < 3:
                         continue
+                    action_code, size_str, filepath = parts
 
-                    is_dir = action_code[1] == 'd'
-                    is_delete = line.startswith('*deleting')
+                    is_dir = len(action_code) > 1 and action_code[1] == 'd'
+                    is_delete = action_code.startswith('*deleting')
 
                     if is_delete:
                         action = "delete"
-                        filepath = line.split(None, 1)[1] if ' ' in line else ""
                     elif '+' in action_code:
                         action = "transfer"
                     else:
                         action = "update"
 
-                    # Get file size if it's a transfer/update
+                    # Size comes straight from the line (%l), so no stat
+                    # per file over the mount
                     file_size = 0
                     if not is_delete and not is_dir:
-                        full_path = os.path.join(source, filepath)
                         try:
-                            if os.path.exists(full_path):
-                                file_size = os.path.getsize(full_path)
-                                bytes_to_transfer += file_size
-                        except (OSError, PermissionError):
-                            pass
-
-                    files_to_transfer.append(DryRunFile(
-                        path=filepath,
-                        size=file_size,
-                        is_dir=is_dir,
-                        action=action
-                    ))
+                            file_size = int(size_str)
+                        except ValueError:
+                            file_size = 0
+                        bytes_to_transfer += file_size
+
+                    if action in ('transfer', 'update') and not is_dir:
+                        transfer_count += 1
+                    elif action == 'delete':
+                        delete_count += 1
+
+                    if len(files_to_transfer) < 500:
+                        files_to_transfer.append(DryRunFile(
+                            path=filepath,
+                            size=file_size,
+                            is_dir=is_dir,
+                            action=action
+                        ))
+
+            stderr = await stderr_task
+            await process.wait()
 
             # Parse stderr for errors
             for line in stderr.decode().split('\n'):
@@ -407,10 +681,6 @@ class SyncManager:
         except Exception as e:
             return False, f"Dry run failed: {e}"
 
-        # Build result
-        transfer_count = sum(1 for f in files_to_transfer if f.action in ('transfer', 'update') and not f.is_dir)
-        delete_count = sum(1 for f in files_to_transfer if f.action == 'delete')
-
         result = DryRunResult(
             job_id=job_id,
             job_name=job.name,
@@ -422,94 +692,265 @@ class SyncManager:
             total_source_files=total_files,
             total_source_bytes=total_bytes,
             filename_issues=issue_count,
-            files=files_to_transfer[:500],  # Limit to first 500 files
+            files=files_to_transfer,  # Already capped at 500 while streaming
             errors=errors,
         )
 
         return True, result
 
-    def _get_source_stats(self, source_path: str, exclude_patterns: list[str]) -> tuple[int, int]:
-        """Calculate total files and bytes in source directory."""
-        total_files = 0
-        total_bytes = 0
-        try:
-            for root, dirs, files in os.walk(source_path):
-                # Filter excluded patterns
-                for pattern in exclude_patterns:
-                    dirs[:] = [d for d in dirs if not self._matches_pattern(d, pattern)]
-
-                for f in files:
-                    # Skip excluded files
-                    if any(self._matches_pattern(f, p) for p in exclude_patterns):
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compile_excludes(patterns: tuple[str, ...]) -> Optional[re.Pattern]:
+        """Compile exclude patterns into one alternation regex (cached).
+
+        One regex match per entry replaces a Python-level fnmatch call
+        per (name, pattern) pair in the walk inner loops. Returns None
+        when there is nothing to exclude.
+        """
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+    def _drain_scan_queue(
+        self,
+        dirq: queue.Queue,
+        exclude_re: Optional[re.Pattern],
+    ) -> tuple[dict[str, int], dict[str, int], int, list[tuple]]:
+        """Drain directories off the shared scan queue (blocking; in a thread).
+
+        Each queue item is (bucket, path, rel_prefix, dest_dir): one
+        directory to scan, fusing stats, filename checks and dest
+        mirroring, attributed to its top-level bucket. Child directories
+        go back on the queue rather than being recursed in place, so a
+        lopsided tree with one huge top-level item still keeps every pool
+        thread busy. Results are thread-local and merged by the caller;
+        issue tuples are (rel_path, name, is_dir, issue_type, issue_char).
+        """
+        files: dict[str, int] = {}
+        size: dict[str, int] = {}
+        dirs_created = 0
+        issues: list[tuple] = []
+
+        # unfinished_tasks only reaches zero once every claimed directory
+        # has had its children enqueued, so an empty get is a reason to
+        # poll again, not to exit
+        while dirq.unfinished_tasks:
+            try:
+                bucket, path, rel_prefix, dest_dir = dirq.get(timeout=0.02)
+            except queue.Empty:
+                continue
+            try:
+                if dest_dir is not None:
+                    try:
+                        os.makedirs(dest_dir, exist_ok=True)
+                        dirs_created += 1
+                    except (OSError, PermissionError) as e:
+                        print(f"Error creating directory {dest_dir}: {e}")
+
+                try:
+                    with os.scandir(path) as it:
+                        entries = list(it)
+                except (OSError, PermissionError) as e:
+                    print(f"Error scanning {path}: {e}")
+                    continue
+
+                for entry in entries:
+                    name = entry.name
+                    if exclude_re is not None and exclude_re.match(name):
                         continue
+                    rel_path = rel_prefix + name
                     try:
-                        filepath = os.path.join(root, f)
-                        total_bytes += os.path.getsize(filepath)
-                        total_files += 1
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        issue = self._check_filename(name, rel_path)
+                        if issue:
+                            issues.append((rel_path, name, is_dir) + issue)
+                        if is_dir:
+                            dirq.put((
+                                bucket,
+                                entry.path,
+                                rel_path + "/",
+                                dest_dir + "/" + name if dest_dir is not None else None,
+                            ))
+                        elif entry.is_file(follow_symlinks=False):
+                            files[bucket] = files.get(bucket, 0) + 1
+                            size[bucket] = (
+                                size.get(bucket, 0)
+                                + entry.stat(follow_symlinks=False).st_size
+                            )
                     except (OSError, PermissionError):
                         pass
-        except (OSError, PermissionError):
-            pass
-        return total_files, total_bytes
+            finally:
+                dirq.task_done()
+        return files, size, dirs_created, issues
 
-    def _get_item_stats(self, source_path: str, item: str, exclude_patterns: list[str]) -> tuple[int, int]:
-        """Calculate files and bytes for a single item (file or directory)."""
-        item_path = os.path.join(source_path, item)
-        if os.path.isfile(item_path):
+    def _scan_top_level_sync(
+        self,
+        source: str,
+        dest: Optional[str],
+        exclude_re: Optional[re.Pattern],
+    ) -> tuple[list[tuple[str, int, int]], list[str], list[tuple], int]:
+        """Scan only the top level of the source (blocking; in a thread).
+
+        Returns (file items, directory names, issues, dirs created).
+        Subtrees are scanned separately so they can run concurrently.
+        """
+        file_items: list[tuple[str, int, int]] = []
+        dir_names: list[str] = []
+        issues: list[tuple] = []
+        dir_count = 0
+
+        if dest is not None:
             try:
-                return 1, os.path.getsize(item_path)
-            except (OSError, PermissionError):
-                return 0, 0
-        return self._get_source_stats(item_path, exclude_patterns)
+                os.makedirs(dest, exist_ok=True)
+                dir_count += 1
+            except (OSError, PermissionError) as e:
+                print(f"Error creating directory {dest}: {e}")
 
-    def _get_top_level_items(self, source_path: str, exclude_patterns: list[str]) -> list[tuple[str, int, int]]:
-        """Get top-level items with their file counts and sizes."""
-        items = []
         try:
-            for item in os.listdir(source_path):
-                if any(self._matches_pattern(item, p) for p in exclude_patterns):
-                    continue
-                files, bytes_size = self._get_item_stats(source_path, item, exclude_patterns)
-                items.append((item, files, bytes_size))
-        except (OSError, PermissionError):
-            pass
+            with os.scandir(source) as it:
+                top_entries = list(it)
+        except (OSError, PermissionError) as e:
+            print(f"Error scanning {source}: {e}")
+            return file_items, dir_names, issues, dir_count
+
+        for entry in top_entries:
+            name = entry.name
+            if exclude_re is not None and exclude_re.match(name):
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                issue = self._check_filename(name, name)
+                if issue:
+                    issues.append((name, name, is_dir) + issue)
+                if is_dir:
+                    dir_names.append(name)
+                elif entry.is_file(follow_symlinks=False):
+                    file_items.append((name, 1, entry.stat(follow_symlinks=False).st_size))
+            except (OSError, PermissionError):
+                pass
+
+        return file_items, dir_names, issues, dir_count
+
+    # Concurrent subtree scans during preflight; FUSE stat latency, not
+    # CPU, is the bottleneck, so overlapping requests helps, but too many
+    # at once just queues up in the FUSE daemon
+    _PREFLIGHT_CONCURRENCY = 8
+
+    async def _preflight_combined(
+        self,
+        job_id: str,
+        job_name: str,
+        source: str,
+        dest: Optional[str],
+        exclude_patterns: list[str],
+    ) -> tuple[list[tuple[str, int, int]], int, int]:
+        """Run the fused preflight walk and record filename issues.
+
+        Returns (top-level items, issue count, directories created).
+        """
+        from webapp.services.filename_issues import filename_issues_manager
+
+        # Clear previous issues for this job
+        await filename_issues_manager.clear_job_issues(job_id)
+
+        loop = asyncio.get_running_loop()
+        exclude_re = self._compile_excludes(tuple(exclude_patterns))
+        file_items, dir_names, issues, dir_count = await loop.run_in_executor(
+            self._scan_executor, self._scan_top_level_sync, source, dest, exclude_re
+        )
+
+        # Walk all subtrees through one shared directory queue drained by
+        # the scan pool. Seeding with the top-level directories and
+        # letting drains push child directories back spreads even a
+        # single dominant subtree across every thread, while the pool
+        # size still bounds how many scans hit the FUSE daemon at once.
+        # Each drain keeps thread-local results merged here.
+        items = list(file_items)
+        if dir_names:
+            dirq: queue.Queue = queue.Queue()
+            for name in dir_names:
+                dirq.put((
+                    name,
+                    source + "/" + name,
+                    name + "/",
+                    dest + "/" + name if dest is not None else None,
+                ))
+            drains = [
+                loop.run_in_executor(
+                    self._scan_executor, self._drain_scan_queue, dirq, exclude_re
+                )
+                for _ in range(self._PREFLIGHT_CONCURRENCY)
+            ]
+            bucket_files: dict[str, int] = {}
+            bucket_bytes: dict[str, int] = {}
+            for files_part, bytes_part, dirs_created, issues_part in await asyncio.gather(*drains):
+                for name, count in files_part.items():
+                    bucket_files[name] = bucket_files.get(name, 0) + count
+                for name, total in bytes_part.items():
+                    bucket_bytes[name] = bucket_bytes.get(name, 0) + total
+                dir_count += dirs_created
+                issues.extend(issues_part)
+            for name in dir_names:
+                items.append((name, bucket_files.get(name, 0), bucket_bytes.get(name, 0)))
+
         # Sort by size descending for better distribution
         items.sort(key=lambda x: x[2], reverse=True)
-        return items
+
+        if issues:
+            await filename_issues_manager.add_issues_bulk(
+                job_id, job_name, source, issues
+            )
+            await filename_issues_manager.save()
+
+        return items, len(issues), dir_count
 
     def _distribute_items(self, items: list[tuple[str, int, int]], num_workers: int) -> list[list[tuple[str, int, int]]]:
-        """Distribute items across workers using greedy load balancing."""
-        if not items:
-            return [[] for _ in range(num_workers)]
+        """Distribute items across workers using greedy load balancing.
 
-        # Use greedy algorithm: assign largest item to worker with least total size
-        worker_loads = [0] * num_workers
+        Items arrive sorted by size descending; a min-heap of worker loads
+        makes the greedy assignment O(N log W) instead of a linear scan
+        per item.
+        """
         worker_items: list[list[tuple[str, int, int]]] = [[] for _ in range(num_workers)]
+        if not items:
+            return worker_items
+
+        # With at most one item per worker no balancing is needed
+        if len(items) <= num_workers:
+            for i, item in enumerate(items):
+                worker_items[i].append(item)
+            return worker_items
 
+        # Assign each item to the currently least-loaded worker
+        heap = [(0, i) for i in range(num_workers)]
+        heapq.heapify(heap)
         for item in items:
-            # Find worker with minimum load
-            min_worker = min(range(num_workers), key=lambda w: worker_loads[w])
-            worker_items[min_worker].append(item)
-            worker_loads[min_worker] += item[2]  # Add bytes to load
+            load, w = heapq.heappop(heap)
+            worker_items[w].append(item)
+            heapq.heappush(heap, (load + item[2], w))
 
         return worker_items
 
-    def _matches_pattern(self, name: str, pattern: str) -> bool:
-        """Simple pattern matching for exclude patterns."""
-        import fnmatch
-        return fnmatch.fnmatch(name, pattern)
-
     async def _log_errors(self, job_name: str, job_id: str, errors: list[str]):
         """Log errors to the errors.log file."""
         error_log_path = os.path.join(settings.log_path, "errors.log")
         os.makedirs(os.path.dirname(error_log_path), exist_ok=True)
 
         timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        # Assemble the whole block first: one open+write+close in a
+        # single thread dispatch instead of one threadpool hop per
+        # aiofiles call and one write per error line
+        block = (
+            f"\n[{timestamp}] Job: {job_name} ({job_id})\n"
+            + "".join(f"  {error}\n" for error in errors)
+        )
+
+        def _append():
+            with open(error_log_path, "a") as f:
+                f.write(block)
+
         try:
-            async with aiofiles.open(error_log_path, "a") as f:
-                await f.write(f"\n[{timestamp}] Job: {job_name} ({job_id})\n")
-                for error in errors:
-                    await f.write(f"  {error}\n")
+            await asyncio.to_thread(_append)
         except Exception as e:
             print(f"Error writing to errors.log: {e}")
 
@@ -525,291 +966,369 @@ class SyncManager:
         '|': ('pipe', '|'),
         '\x00': ('null_byte', '\x00'),
     }
-    # Control characters (0x00-0x1F)
-    CONTROL_CHARS = set(chr(i) for i in range(32))
+    # Deletion table covering problematic and control characters; a name
+    # is clean iff translate removes nothing, which is one C-level scan
+    _BAD_TRANSLATE = str.maketrans(
+        "", "", "".join(PROBLEMATIC_CHARS) + "".join(chr(i) for i in range(1, 32))
+    )
+
+    # One search both finds and identifies the offending character on the
+    # slow path; \x00 stays 'null_byte' because PROBLEMATIC_CHARS wins
+    _BAD_CHARS_RE = re.compile(r'[\\:*?"<>|\x00-\x1f]')
+    _CHAR_TO_TYPE = {
+        **{chr(i): 'control_char' for i in range(32)},
+        **{char: issue_type for char, (issue_type, _) in PROBLEMATIC_CHARS.items()},
+    }
+
+    # Edge-of-name issues in one search; the matched group name is the
+    # issue type. The lookbehinds keep '.' and '..' out of trailing_dot.
+    _EDGE_RE = re.compile(
+        r'^(?P<leading_space> )'
+        r'|(?P<trailing_space> $)'
+        r'|(?P<trailing_dot>(?<=.)(?<!^\.)\.$)'
+    )
 
     def _check_filename(self, name: str, rel_path: str) -> Optional[tuple[str, Optional[str]]]:
         """Check a filename for problematic characters. Returns (issue_type, issue_char) or None."""
-        # Check for problematic characters
-        for char, (issue_type, _) in self.PROBLEMATIC_CHARS.items():
-            if char in name:
-                return (issue_type, char)
-
-        # Check for control characters
-        for char in name:
-            if char in self.CONTROL_CHARS:
-                return ('control_char', char)
-
-        # Check for leading/trailing spaces (cross-platform issues)
-        if name.startswith(' '):
-            return ('leading_space', ' ')
-        if name.endswith(' '):
-            return ('trailing_space', ' ')
-
-        # Check for trailing dots (Windows issue)
-        if name.endswith('.') and name != '.' and name != '..':
-            return ('trailing_dot', '.')
-
-        # Check for very long filenames (255 byte limit common)
-        if len(name.encode('utf-8')) > 255:
-            return ('too_long', None)
-
-        return None
-
-    async def _preflight_check_filenames(
-        self,
-        job_id: str,
-        job_name: str,
-        source: str,
-        exclude_patterns: list[str]
-    ) -> int:
-        """Check all filenames for problematic characters. Saves issues to manager. Returns count."""
-        from webapp.services.filename_issues import filename_issues_manager
-
-        # Clear previous issues for this job
-        await filename_issues_manager.clear_job_issues(job_id)
-
-        issue_count = 0
-        try:
-            for root, dirs, files in os.walk(source):
-                # Filter excluded directories
-                dirs[:] = [d for d in dirs if not any(self._matches_pattern(d, p) for p in exclude_patterns)]
-
-                rel_root = os.path.relpath(root, source)
-
-                # Check directory names
-                for d in dirs:
-                    rel_path = os.path.join(rel_root, d) if rel_root != '.' else d
-                    issue = self._check_filename(d, rel_path)
-                    if issue:
-                        issue_type, issue_char = issue
-                        await filename_issues_manager.add_issue(
-                            job_id=job_id,
-                            job_name=job_name,
-                            source_base=source,
-                            relative_path=rel_path,
-                            filename=d,
-                            is_dir=True,
-                            issue_type=issue_type,
-                            issue_char=issue_char,
-                        )
-                        issue_count += 1
-
-                # Check file names
-                for f in files:
-                    if any(self._matches_pattern(f, p) for p in exclude_patterns):
-                        continue
-                    rel_path = os.path.join(rel_root, f) if rel_root != '.' else f
-                    issue = self._check_filename(f, rel_path)
-                    if issue:
-                        issue_type, issue_char = issue
-                        await filename_issues_manager.add_issue(
-                            job_id=job_id,
-                            job_name=job_name,
-                            source_base=source,
-                            relative_path=rel_path,
-                            filename=f,
-                            is_dir=False,
-                            issue_type=issue_type,
-                            issue_char=issue_char,
-                        )
-                        issue_count += 1
+        # Fast path: this runs per entry in the preflight walk and almost
+        # all names are clean, so detect that with C-level operations and
+        # only fall through to the per-character identification on a hit.
+        # isascii() sidesteps the UTF-8 encode for the length check.
+        if (
+            len(name.translate(self._BAD_TRANSLATE)) == len(name)
+            and not name.startswith(' ')
+            and not name.endswith((' ', '.'))
+            and (len(name) <= 255 if name.isascii() else len(name.encode('utf-8')) <= 255)
+        ):
+            return None
 
-        except (OSError, PermissionError) as e:
-            print(f"Error scanning filenames: {e}")
+        # Check for problematic and control characters in one C-level
+        # search; the table maps the hit back to its issue type
+        match = self._BAD_CHARS_RE.search(name)
+        if match:
+            char = match.group()
+            return (self._CHAR_TO_TYPE[char], char)
 
-        # Save all issues
-        await filename_issues_manager.save()
-        return issue_count
+        # Leading/trailing spaces and trailing dots (cross-platform and
+        # Windows issues) dispatched by one search and the group name
+        match = self._EDGE_RE.search(name)
+        if match:
+            return (match.lastgroup, match.group())
 
-    def _preflight_create_dirs(self, source: str, dest: str, exclude_patterns: list[str]) -> int:
-        """Create directory structure on destination before sync. Returns directory count."""
-        dir_count = 0
-        try:
-            for root, dirs, files in os.walk(source):
-                # Filter excluded directories
-                dirs[:] = [d for d in dirs if not any(self._matches_pattern(d, p) for p in exclude_patterns)]
-
-                # Create corresponding directory on destination
-                rel_path = os.path.relpath(root, source)
-                if rel_path == '.':
-                    dest_dir = dest
-                else:
-                    dest_dir = os.path.join(dest, rel_path)
+        # Check for very long filenames (255 byte limit common); ASCII
+        # names don't need the encode to measure bytes
+        if (len(name) if name.isascii() else len(name.encode('utf-8'))) > 255:
+            return ('too_long', None)
 
-                os.makedirs(dest_dir, exist_ok=True)
-                dir_count += 1
-        except (OSError, PermissionError) as e:
-            print(f"Error creating directory structure: {e}")
-        return dir_count
+        return None
 
     async def _run_worker(
         self,
         worker_id: int,
-        items: list[tuple[str, int, int]],
+        shard_queue: asyncio.Queue,
         source: str,
         dest: str,
         rsync_opts: list[str],
         progress: SyncProgress,
         job_id: str,
+        exclude_fd: Optional[int] = None,
     ) -> tuple[int, int, list[str]]:
-        """Run rsync for a subset of items assigned to this worker."""
+        """Pull item shards from the shared queue and rsync each one.
+
+        Workers keep claiming shards until the queue is drained, so a
+        worker that finishes early takes over remaining work instead of
+        idling behind a straggler.
+        """
         worker = progress.workers[worker_id]
         worker.status = "running"
         error_lines = []
         files_done = 0
         bytes_done = 0
-        last_notify_time = datetime.utcnow()
+        stop_event = self.stop_requested[job_id]
+        health_checked = False
 
-        for item_name, item_files, item_bytes in items:
-            # Check for stop request before each item
-            if self.stop_requested.get(job_id):
-                worker.status = "stopped"
-                worker.current_file = None
+        while not stop_event.is_set():
+            try:
+                items = shard_queue.get_nowait()
+            except asyncio.QueueEmpty:
                 break
 
-            # Check mount health before each item to fail fast if LucidLink died
-            is_healthy, health_error = self._check_lucidlink_healthy()
-            if not is_healthy:
-                error_lines.append(f"[Worker {worker_id}] Mount unhealthy: {health_error}")
-                # Signal stop for all workers
-                self.stop_requested[job_id] = True
-                worker.status = "failed"
-                worker.current_file = None
-                break
+            if not health_checked:
+                # Check mount health once before the first shard to fail
+                # fast if LucidLink died
+                is_healthy, health_error = self._check_lucidlink_healthy()
+                if not is_healthy:
+                    error_lines.append(f"[Worker {worker_id}] Mount unhealthy: {health_error}")
+                    # Signal stop for all workers
+                    stop_event.set()
+                    worker.status = "failed"
+                    break
+                health_checked = True
+
+            # Grow this worker's targets as it claims work
+            worker.items.extend(item[0] for item in items)
+            worker.files_total += sum(item[1] for item in items)
+            worker.bytes_total += sum(item[2] for item in items)
+
+            f, b = await self._run_worker_batch(
+                worker_id, items, source, dest, rsync_opts,
+                progress, job_id, worker, error_lines, stop_event,
+                exclude_fd,
+            )
+            files_done += f
+            bytes_done += b
 
-            item_source = os.path.join(source, item_name)
-            worker.current_file = item_name
+        if worker.status != "stopped":
+            worker.status = "completed" if not error_lines else "failed"
+        worker.current_file = None
+        # Each worker leaves exactly once, so decrement instead of
+        # recounting every worker's status
+        progress.active_workers = max(progress.active_workers - 1, 0)
+        return files_done, bytes_done, error_lines
 
-            # Add --info=progress2 for real-time byte progress
-            cmd_opts = rsync_opts + ["--info=progress2", "--no-inc-recursive"]
+    @staticmethod
+    def _signal_worker(process, sig: int = signal.SIGTERM):
+        """Signal a worker rsync's whole process group.
 
-            # Determine if item is file or directory
-            if os.path.isfile(item_source):
-                cmd = ["rsync"] + cmd_opts + [item_source, dest]
-            else:
-                cmd = ["rsync"] + cmd_opts + [item_source + "/", os.path.join(dest, item_name) + "/"]
+        Workers are spawned with start_new_session=True, so the group id
+        is the pid and the signal reaches any children rsync forked too.
+        Falls back to the single pid if the group is already gone.
+        """
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            try:
+                process.send_signal(sig)
+            except ProcessLookupError:
+                pass
 
-            item_bytes_transferred = 0
+    async def _run_worker_batch(
+        self,
+        worker_id: int,
+        items: list[tuple[str, int, int]],
+        source: str,
+        dest: str,
+        rsync_opts: list[str],
+        progress: SyncProgress,
+        job_id: str,
+        worker: WorkerProgress,
+        error_lines: list[str],
+        stop_event: asyncio.Event,
+        exclude_fd: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Sync one shard of items through a single rsync process.
+
+        The item list is fed NUL-separated to --files-from on stdin, so
+        each shard pays one fork/exec and one rsync startup instead of
+        one per top-level item.
+        """
+        batch_files = sum(item[1] for item in items)
+        batch_bytes = sum(item[2] for item in items)
+        shard_files = 0
+        shard_bytes = 0
+        cmd = ["rsync"] + rsync_opts + [
+            # --files-from disables the recursion implied by -a, so ask
+            # for it back explicitly
+            "--recursive",
+            "--files-from=-",
+            "--from0",
+            # One deterministic "name\tsize" line per transferred file:
+            # exact byte accounting with a C-level split instead of
+            # reverse-engineering the human progress string with a regex.
+            # name1 keeps the per-file mentions out-format rides on;
+            # name0 would suppress the very lines being parsed
+            "--out-format=%n\t%l",
+            "--info=name1,stats0",
+            "--no-inc-recursive",
+            source + "/",
+            dest + "/",
+        ]
+        worker.current_file = f"Syncing {len(items)} top-level items"
+        stdout_transport = None
 
+        try:
+            # Hand rsync a manually created stdout pipe, enlarged from the
+            # default 64 KiB so a burst of per-file lines doesn't block
+            # rsync on a full pipe between our reads. Fishing the fd out
+            # of the subprocess transport only works on the selector loop
+            # (uvloop exposes no "pipe" extra), so the pipe is made and
+            # resized here before the spawn. F_SETPIPE_SZ stays best
+            # effort: it can be refused under pipe-user-pages limits.
+            stdout_r, stdout_w = os.pipe()
+            try:
+                fcntl.fcntl(stdout_w, fcntl.F_SETPIPE_SZ, 1 << 20)
+            except OSError:
+                pass
             try:
                 process = await asyncio.create_subprocess_exec(
                     *cmd,
-                    stdout=asyncio.subprocess.PIPE,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=stdout_w,
                     stderr=asyncio.subprocess.STDOUT,
+                    pass_fds=(exclude_fd,) if exclude_fd is not None else (),
+                    # Own session so stop/cleanup can signal the whole group,
+                    # plus die-with-parent insurance set pre-exec
+                    start_new_session=True,
+                    preexec_fn=_worker_preexec,
                 )
+            except BaseException:
+                os.close(stdout_r)
+                raise
+            finally:
+                # The child holds its own copy of the write end
+                os.close(stdout_w)
+
+            loop = asyncio.get_running_loop()
+            stdout_reader = asyncio.StreamReader(loop=loop)
+            stdout_transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(stdout_reader, loop=loop),
+                os.fdopen(stdout_r, "rb"),
+            )
 
-                # Track this process for potential termination
-                if job_id in self.worker_processes:
-                    self.worker_processes[job_id].append(process)
+            # Track this process for potential termination
+            if job_id in self.worker_processes:
+                self.worker_processes[job_id].append(process)
+
+            # Hand rsync its file list and close stdin so it can start
+            process.stdin.write(
+                b"\0".join(name.encode() for name, _, _ in items) + b"\0"
+            )
+            await process.stdin.drain()
+            process.stdin.close()
 
+            try:
+                # Block on the stream and the stop event together instead
+                # of polling readline with a 0.5s timeout, so the loop only
+                # wakes when there is a line to parse or a stop to honor
+                stop_wait = asyncio.create_task(stop_event.wait())
+                read_task: Optional[asyncio.Task] = None
+                # rsync separates progress updates with \r, not \n, so a
+                # fast transfer emits one enormous "line". Read 64 KiB
+                # chunks and split on both terminators: one event-loop
+                # wakeup covers a whole burst of updates.
+                buffer = b""
+                fatal = False
                 try:
-                    while True:
-                        # Check for stop request during execution
-                        if self.stop_requested.get(job_id):
-                            process.terminate()
+                    while not fatal:
+                        read_task = asyncio.create_task(stdout_reader.read(65536))
+                        await asyncio.wait(
+                            {read_task, stop_wait},
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if stop_wait.done():
+                            read_task.cancel()
+                            self._signal_worker(process)
                             await asyncio.wait_for(process.wait(), timeout=5.0)
                             worker.status = "stopped"
                             break
 
-                        try:
-                            line = await asyncio.wait_for(process.stdout.readline(), timeout=0.5)
+                        chunk = read_task.result()
+                        if not chunk:
+                            break
+                        buffer += chunk
+                        if b"\n" not in buffer and b"\r" not in buffer:
+                            continue
+                        *lines, buffer = buffer.replace(b"\r", b"\n").split(b"\n")
+                        for line in lines:
                             if not line:
-                                break
-                            line_text = line.decode().strip()
+                                continue
 
-                            # Check for errors
-                            if line_text.startswith("rsync:") or line_text.startswith("rsync error:"):
+                            # Error lines; only these pay a decode
+                            if line[0:1] == b"r" and line.startswith((b"rsync:", b"rsync error:")):
+                                line_text = line.decode(errors="replace").strip()
                                 error_lines.append(f"[Worker {worker_id}] {line_text}")
 
                                 # Check for fatal mount errors - stop all workers immediately
                                 if "Transport endpoint is not connected" in line_text or \
                                    "Stale file handle" in line_text:
                                     print(f"[Worker {worker_id}] FATAL: Mount disconnected, stopping all workers")
-                                    self.stop_requested[job_id] = True
-                                    process.terminate()
+                                    stop_event.set()
+                                    self._signal_worker(process)
                                     worker.status = "failed"
+                                    fatal = True
                                     break
 
                                 continue
 
-                            # Parse --info=progress2 output
-                            # Format: "  1,234,567  45%   12.34MB/s    0:01:23" or with xfr
-                            match = re.search(
-                                r'^\s*([\d,]+)\s+(\d+)%\s+([\d.]+\S*/s)',
-                                line_text
-                            )
-                            if match:
-                                bytes_str, percent, rate = match.groups()
-                                item_bytes_transferred = int(bytes_str.replace(",", ""))
-                                worker.bytes_transferred = bytes_done + item_bytes_transferred
-                                worker.transfer_rate = rate
-
-                                # Update overall progress - throttle to every 0.5s
-                                now = datetime.utcnow()
-                                if (now - last_notify_time).total_seconds() >= 0.5:
-                                    progress.bytes_transferred = sum(w.bytes_transferred for w in progress.workers)
-                                    if progress.bytes_total > 0:
-                                        progress.percent_complete = (progress.bytes_transferred / progress.bytes_total) * 100
-                                    progress.transfer_rate = rate
-                                    progress.updated_at = now
-                                    await self._notify_progress(job_id, progress)
-                                    last_notify_time = now
-
-                        except asyncio.TimeoutError:
-                            # Just a timeout, continue checking
-                            if process.returncode is not None:
-                                break
-                            continue
+                            # "name\tsize" per transferred entry; anything
+                            # without the tab is rsync chatter
+                            name, tab, size_str = line.rpartition(b"\t")
+                            if not tab or name.endswith(b"/"):
+                                # Directories carry no payload bytes
+                                continue
+                            try:
+                                size = int(size_str)
+                            except ValueError:
+                                continue
 
-                    if not self.stop_requested.get(job_id):
-                        await process.wait()
-
-                        if process.returncode == 0:
-                            files_done += item_files
-                            bytes_done += item_bytes
-                            worker.files_transferred = files_done
-                            worker.bytes_transferred = bytes_done
-                            # Update overall progress
-                            progress.files_transferred = sum(w.files_transferred for w in progress.workers)
-                            progress.bytes_transferred = sum(w.bytes_transferred for w in progress.workers)
+                            worker.current_file = name.decode("utf-8", errors="replace")
+                            shard_files += 1
+                            shard_bytes += size
+                            worker.files_transferred += 1
+                            worker.bytes_transferred += size
+                            # Bump the job-wide counters by this worker's
+                            # delta instead of re-summing all workers per
+                            # line
+                            progress.files_transferred += 1
+                            progress.bytes_transferred += size
+
+                            # Schedule rather than await: the per-job
+                            # flusher rate-limits and drops no-delta
+                            # snapshots, so this stays O(1) per line
                             if progress.bytes_total > 0:
                                 progress.percent_complete = (progress.bytes_transferred / progress.bytes_total) * 100
-                            progress.updated_at = datetime.utcnow()
-                            await self._notify_progress(job_id, progress)
-                        elif process.returncode != -15:  # -15 is SIGTERM
-                            error_lines.append(f"[Worker {worker_id}] Failed to sync {item_name}: exit code {process.returncode}")
-
-                except asyncio.CancelledError:
-                    # Task was cancelled, terminate process
-                    if process.returncode is None:
-                        process.terminate()
-                        try:
-                            await asyncio.wait_for(process.wait(), timeout=5.0)
-                        except asyncio.TimeoutError:
-                            process.kill()
-                    raise
+                            self._schedule_notify(job_id, progress)
+                finally:
+                    stop_wait.cancel()
+                    if read_task is not None and not read_task.done():
+                        read_task.cancel()
+
+                if not stop_event.is_set():
+                    await process.wait()
+
+                    if process.returncode == 0:
+                        # Settle the shard at its preflight totals: files
+                        # rsync skipped as already in sync never produced
+                        # a line, so reconcile the running sums by delta
+                        progress.files_transferred += batch_files - shard_files
+                        worker.files_transferred += batch_files - shard_files
+                        progress.bytes_transferred += batch_bytes - shard_bytes
+                        worker.bytes_transferred += batch_bytes - shard_bytes
+                        if progress.bytes_total > 0:
+                            progress.percent_complete = (progress.bytes_transferred / progress.bytes_total) * 100
+                        self._schedule_notify(job_id, progress)
+                        return batch_files, batch_bytes
+                    elif process.returncode != -15:  # -15 is SIGTERM
+                        error_lines.append(f"[Worker {worker_id}] Failed to sync batch: exit code {process.returncode}")
 
             except asyncio.CancelledError:
-                worker.status = "stopped"
+                # Task was cancelled, terminate process group
+                if process.returncode is None:
+                    self._signal_worker(process)
+                    try:
+                        await asyncio.wait_for(process.wait(), timeout=5.0)
+                    except asyncio.TimeoutError:
+                        self._signal_worker(process, signal.SIGKILL)
                 raise
-            except Exception as e:
-                error_lines.append(f"[Worker {worker_id}] Error syncing {item_name}: {e}")
 
-            # Check stop again after item completion
-            if self.stop_requested.get(job_id):
-                worker.status = "stopped"
-                break
+        except asyncio.CancelledError:
+            worker.status = "stopped"
+            raise
+        except Exception as e:
+            error_lines.append(f"[Worker {worker_id}] Error syncing batch: {e}")
+        finally:
+            if stdout_transport is not None:
+                stdout_transport.close()
 
-        if worker.status != "stopped":
-            worker.status = "completed" if not error_lines else "failed"
-        worker.current_file = None
-        progress.active_workers = sum(1 for w in progress.workers if w.status == "running")
-        return files_done, bytes_done, error_lines
+        if stop_event.is_set():
+            worker.status = "stopped"
+
+        return 0, 0
 
     async def _run_sync(self, job: SyncJob):
         """Run the sync process for a job using parallel workers."""
         job_id = job.id
+        exclude_fd: Optional[int] = None
 
         try:
             source = job.source_path.rstrip("/")
@@ -821,11 +1340,17 @@ class SyncManager:
                 progress = SyncProgress(job_id=job_id, status=JobStatus.RUNNING, started_at=datetime.utcnow())
                 self.progress[job_id] = progress
 
-            # Calculate source stats and get top-level items (run in executor)
-            loop = asyncio.get_event_loop()
-            items = await loop.run_in_executor(
-                None, self._get_top_level_items, source, job.exclude_patterns
+            # Pre-flight: one fused walk gathers per-item stats, checks
+            # filenames and mirrors the directory structure on dest
+            progress.current_file = "Pre-flight: Scanning source..."
+            self._schedule_notify(job_id, progress)
+
+            items, issue_count, dir_count = await self._preflight_combined(
+                job_id, job.name, source, dest, job.exclude_patterns
             )
+            if issue_count > 0:
+                progress.current_file = f"Pre-flight: {issue_count} filename issues found (see Filename Issues)"
+                self._schedule_notify(job_id, progress)
 
             # Calculate totals
             total_files = sum(item[1] for item in items)
@@ -834,69 +1359,67 @@ class SyncManager:
             # Determine number of workers (at most as many as items)
             num_workers = min(job.parallel_jobs, len(items)) if items else 1
 
-            # Distribute items across workers
-            worker_items = self._distribute_items(items, num_workers)
-
-            # Initialize worker progress objects
+            # Shard items into a few balanced batches per worker and let
+            # the workers pull shards from a shared queue. A static
+            # one-partition-per-worker split leaves the whole job waiting
+            # on whichever worker drew the slowest share; with stealing,
+            # the first worker to finish picks up the next shard instead
+            # of idling, while each shard still rides one rsync process.
+            num_shards = min(len(items), num_workers * 4) if items else 0
+            shard_queue: asyncio.Queue = asyncio.Queue()
+            for shard in self._distribute_items(items, num_shards) if num_shards else []:
+                shard_queue.put_nowait(shard)
+
+            # Initialize worker progress objects. The transferred counters
+            # are running totals bumped incrementally by the workers, so
+            # they must start from zero for this run. Per-worker targets
+            # are unknowable upfront under work stealing; they grow as
+            # each worker claims shards.
             progress.files_total = total_files
             progress.bytes_total = total_bytes
+            progress.files_transferred = 0
+            progress.bytes_transferred = 0
             progress.workers = []
             for i in range(num_workers):
-                w_items = worker_items[i]
                 wp = WorkerProgress(
                     worker_id=i,
-                    items=[item[0] for item in w_items],
-                    files_total=sum(item[1] for item in w_items),
-                    bytes_total=sum(item[2] for item in w_items),
+                    items=[],
+                    files_total=0,
+                    bytes_total=0,
                     status="pending"
                 )
                 progress.workers.append(wp)
 
             progress.active_workers = num_workers
-            progress.updated_at = datetime.utcnow()
-            await self._notify_progress(job_id, progress)
+            self._schedule_notify(job_id, progress)
 
             # Build rsync options
             rsync_opts = job.rsync_options.split()
             # Remove --info=progress2 for parallel mode (too noisy)
             rsync_opts = [opt for opt in rsync_opts if opt != "--info=progress2"]
-            for pattern in job.exclude_patterns:
-                rsync_opts.extend(["--exclude", pattern])
-
-            # Pre-flight: Check filenames for problematic characters
-            progress.current_file = "Pre-flight: Checking filenames..."
-            progress.updated_at = datetime.utcnow()
-            await self._notify_progress(job_id, progress)
-
-            issue_count = await self._preflight_check_filenames(
-                job_id, job.name, source, job.exclude_patterns
-            )
-            if issue_count > 0:
-                progress.current_file = f"Pre-flight: {issue_count} filename issues found (see Filename Issues)"
-                progress.updated_at = datetime.utcnow()
-                await self._notify_progress(job_id, progress)
+            if job.exclude_patterns:
+                # Write the patterns to one in-memory file shared by every
+                # worker instead of expanding --exclude per pattern into
+                # each argv. rsync opens /proc/self/fd/N itself, so each
+                # child reads the list from offset 0 through the inherited
+                # descriptor
+                exclude_fd = os.memfd_create("rsync-excludes")
+                os.write(exclude_fd, "\n".join(job.exclude_patterns).encode() + b"\n")
+                os.lseek(exclude_fd, 0, os.SEEK_SET)
+                rsync_opts.append(f"--exclude-from=/proc/self/fd/{exclude_fd}")
 
-            # Pre-flight: Create directory structure on destination
-            progress.current_file = "Pre-flight: Creating directories..."
-            progress.updated_at = datetime.utcnow()
-            await self._notify_progress(job_id, progress)
-
-            dir_count = await loop.run_in_executor(
-                None, self._preflight_create_dirs, source, dest, job.exclude_patterns
-            )
             progress.current_file = f"Pre-flight: Created {dir_count} directories"
-            progress.updated_at = datetime.utcnow()
-            await self._notify_progress(job_id, progress)
+            self._schedule_notify(job_id, progress)
 
             # Initialize tracking for graceful shutdown
             self.running_processes[job_id] = True  # Mark as running
             self.worker_processes[job_id] = []  # Track subprocess objects
-            self.stop_requested[job_id] = False  # Reset stop flag
+            self.stop_requested[job_id] = asyncio.Event()  # Fresh stop signal
 
             # Run workers in parallel
             tasks = [
                 asyncio.create_task(
-                    self._run_worker(i, worker_items[i], source, dest, rsync_opts, progress, job_id)
+                    self._run_worker(i, shard_queue, source, dest, rsync_opts, progress, job_id, exclude_fd)
                 )
                 for i in range(num_workers)
             ]
@@ -935,7 +1458,8 @@ class SyncManager:
 
             # Update final status
             # Check if job was stopped by user (stop_job already set STOPPED status)
-            was_stopped = self.stop_requested.get(job_id, False)
+            stop_event = self.stop_requested.get(job_id)
+            was_stopped = stop_event.is_set() if stop_event else False
 
             if was_stopped:
                 # User requested stop - status already set by stop_job(), don't overwrite
@@ -976,6 +1500,8 @@ class SyncManager:
                 self.progress[job_id].error_message = str(e)
 
         finally:
+            if exclude_fd is not None:
+                os.close(exclude_fd)
             # Clean up all tracking dictionaries
             if job_id in self.running_processes:
                 del self.running_processes[job_id]
@@ -985,48 +1511,40 @@ class SyncManager:
                 del self.worker_processes[job_id]
             if job_id in self.stop_requested:
                 del self.stop_requested[job_id]
+            self._mark_dirty(job_id)
             await self.save_jobs()
             if job_id in self.progress:
                 await self._notify_progress(job_id, self.progress[job_id])
 
-    def _parse_rsync_progress(self, line: str, progress: SyncProgress) -> Optional[str]:
-        """Parse rsync --info=progress2 output. Returns error message if line is an error."""
-        # Check for rsync error messages first
-        if line.startswith("rsync:") or line.startswith("rsync error:"):
-            return line  # Return error for logging
-
-        # Example: "    1,234,567  45%   12.34MB/s    0:01:23"
-        match = re.search(
-            r'^\s*([\d,]+)\s+(\d+)%\s+([\d.]+\w+/s)\s+(\d+:\d+:\d+)',
-            line
-        )
-        if match:
-            bytes_str, percent, rate, eta = match.groups()
-            progress.bytes_transferred = int(bytes_str.replace(",", ""))
-            progress.percent_complete = float(percent)
-            progress.transfer_rate = rate
-            progress.eta = eta
-            return None
-
-        # Also check for file being transferred
-        if line and not line.startswith(" ") and "/" in line:
-            progress.current_file = line
-            progress.files_transferred += 1
-
-        return None
-
     def get_progress(self, job_id: str) -> Optional[SyncProgress]:
         """Get current progress for a job."""
         return self.progress.get(job_id)
 
+    def get_progress_map(self, job_ids: list[str]) -> dict[str, SyncProgress]:
+        """Get progress for many jobs in one pass (for list views)."""
+        progress = self.progress
+        return {job_id: progress[job_id] for job_id in job_ids if job_id in progress}
+
     async def get_system_status(self) -> SystemStatus:
         """Get overall system status."""
-        # Check LucidLink connection by verifying FUSE mount in /proc/mounts
+        # Check LucidLink connection by verifying FUSE mount in
+        # /proc/mounts. The scan result is cached for a short TTL (the
+        # mtime of /proc/mounts is not a reliable change signal), so
+        # overlapping dashboard polls share one read without mount
+        # changes going stale for more than a couple of seconds.
         lucidlink_connected = False
         try:
-            with open("/proc/mounts", "r") as f:
-                mounts = f.read()
-                lucidlink_connected = f"{settings.lucidlink_mount_point} fuse" in mounts
+            now = time.monotonic()
+            checked_at, cached = self._mounts_cache
+            if now - checked_at < self._HEALTH_CHECK_TTL:
+                lucidlink_connected = cached
+            else:
+                with open("/proc/mounts", "rb") as f:
+                    # bytes `in` is a C-level memmem over the raw page
+                    lucidlink_connected = (
+                        f"{settings.lucidlink_mount_point} fuse".encode() in f.read()
+                    )
+                self._mounts_cache = (now, lucidlink_connected)
         except Exception:
             pass
 
@@ -1044,6 +1562,15 @@ class SyncManager:
         """Gracefully shutdown all running jobs."""
         for job_id in list(self.running_processes.keys()):
             await self.stop_job(job_id)
+        # Flush any debounced save so the process doesn't exit with
+        # mutations still waiting on the coalescing timer
+        task = self._save_task
+        if (task is not None and not task.done()) or self._save_requested.is_set():
+            if task is not None and not task.done():
+                task.cancel()
+            self._save_requested.clear()
+            await self._write_jobs()
+        self._scan_executor.shutdown(wait=False)
 
 
 # Singleton instance
@@ -0,0 +1,16 @@
+"""
+Shared Jinja2 template environment.
+
+A single Jinja2Templates instance is used across the app so every router
+warms the same template cache; compiled templates are additionally cached
+on disk so a process restart does not re-parse every partial.
+"""
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+TEMPLATES_DIR = "/webapp/templates"
+
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+templates.env.auto_reload = False
+templates.env.cache_size = 400  # Keep all pages + partials hot
+templates.env.bytecode_cache = FileSystemBytecodeCache()